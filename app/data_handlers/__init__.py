@@ -0,0 +1,6 @@
+from .base import DataHandler
+from .csv_handler import CSVHandler
+from .api_handler import APIHandler
+from .database_handler import DatabaseHandler
+
+__all__ = ['DataHandler', 'CSVHandler', 'APIHandler', 'DatabaseHandler']
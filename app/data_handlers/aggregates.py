@@ -0,0 +1,98 @@
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence
+
+class StreamingAggregate(ABC):
+    """Aggregate that is updated one cleaned chunk at a time"""
+    name: str = ''
+
+    @abstractmethod
+    def update(self, chunk: pd.DataFrame):
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        pass
+
+class RowCount(StreamingAggregate):
+    name = 'rows'
+
+    def __init__(self):
+        self.count = 0
+
+    def update(self, chunk: pd.DataFrame):
+        self.count += len(chunk)
+
+    def result(self) -> int:
+        return self.count
+
+class ValueCounts(StreamingAggregate):
+    """Counts of each value in a column, e.g. status"""
+
+    def __init__(self, column: str = 'status'):
+        self.column = column
+        self.name = f"{column}_counts"
+        self.counts = pd.Series(dtype='int64')
+
+    def update(self, chunk: pd.DataFrame):
+        if self.column in chunk.columns:
+            counts = chunk[self.column].astype(str).value_counts()
+            self.counts = self.counts.add(counts, fill_value=0).astype('int64')
+
+    def result(self) -> Dict[str, int]:
+        return self.counts.sort_values(ascending=False).to_dict()
+
+class NumericSummary(StreamingAggregate):
+    """Count, mean, min and max of a numeric column, ignoring values below ``min_valid``"""
+
+    def __init__(self, column: str = 'age', min_valid: Optional[float] = 0):
+        self.column = column
+        self.min_valid = min_valid
+        self.name = f"{column}_summary"
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, chunk: pd.DataFrame):
+        if self.column not in chunk.columns:
+            return
+        values = pd.to_numeric(chunk[self.column], errors='coerce').dropna()
+        if self.min_valid is not None:
+            values = values[values >= self.min_valid]
+        if values.empty:
+            return
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = float(values.min()) if self.min is None else min(self.min, float(values.min()))
+        self.max = float(values.max()) if self.max is None else max(self.max, float(values.max()))
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max
+        }
+
+class DailyTotals(StreamingAggregate):
+    """Per-day sums of metric columns plus a row count, e.g. social engagement"""
+
+    def __init__(self, date_column: str = 'date', metrics: Sequence[str] = ('likes', 'retweets')):
+        self.date_column = date_column
+        self.metrics = list(metrics)
+        self.name = 'daily_totals'
+        self.totals: Optional[pd.DataFrame] = None
+
+    def update(self, chunk: pd.DataFrame):
+        if self.date_column not in chunk.columns:
+            return
+        days = pd.to_datetime(chunk[self.date_column], errors='coerce').dt.floor('D')
+        metrics = [col for col in self.metrics if col in chunk.columns]
+        frame = chunk[metrics].apply(pd.to_numeric, errors='coerce').fillna(0)
+        frame['rows'] = 1
+        daily = frame.groupby(days).sum()
+        self.totals = daily if self.totals is None else self.totals.add(daily, fill_value=0)
+
+    def result(self) -> pd.DataFrame:
+        return self.totals.sort_index() if self.totals is not None else pd.DataFrame()
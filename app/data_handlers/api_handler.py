@@ -0,0 +1,55 @@
+import io
+import logging
+import requests
+import pandas as pd
+from typing import Optional
+from src.services.cache_service import CacheService
+from src.services.http_client import FetchResult, HTTPClient
+from src.services.json_stream import DEFAULT_BATCH_SIZE, FrameBuilder, JSONPage
+from .base import DataHandler
+
+logger = logging.getLogger(__name__)
+
+class APIHandler(DataHandler):
+    def __init__(self, api_url: Optional[str] = None, cache_dir: str = "data/cache/api",
+                 session: Optional[requests.Session] = None, stream: bool = False,
+                 records_path: Optional[str] = None, next_key: Optional[str] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, fill_defaults: bool = True):
+        self.api_url = api_url or "https://api.example.com/hostages"
+        # Pooled, retrying session; the cleaned frame is cached with the
+        # response validators so unchanged data costs a single 304
+        self.client = HTTPClient(CacheService(cache_dir), session=session)
+        self.last_result: Optional[FetchResult] = None
+        # stream=True follows pagination and parses each page incrementally;
+        # records_path/next_key locate the records and next-page URL in the body
+        self.stream = stream
+        self.records_path = records_path
+        self.next_key = next_key
+        self.batch_size = batch_size
+        self.fill_defaults = fill_defaults
+
+    def _parse(self, response: requests.Response) -> pd.DataFrame:
+        builder = FrameBuilder(self.batch_size, clean=self.clean_data)
+        builder.extend(JSONPage(io.BytesIO(response.content), self.records_path))
+        return builder.build()
+
+    def fetch_data(self) -> pd.DataFrame:
+        """Fetch and clean API data; raises on connection failures and error statuses left after retries"""
+        if self.stream:
+            return self.client.fetch_paginated(
+                self.api_url,
+                records_path=self.records_path,
+                next_key=self.next_key,
+                batch_size=self.batch_size,
+                clean=self.clean_data
+            )
+        self.last_result = self.client.fetch(self.api_url, self._parse)
+        return self.last_result.data
+
+    def read_data(self) -> pd.DataFrame:
+        """Read and clean API data"""
+        try:
+            return self.fetch_data()
+        except Exception as e:
+            logger.error(f"Error reading from API: {str(e)}")
+            return pd.DataFrame()
@@ -0,0 +1,50 @@
+import logging
+import pandas as pd
+from typing import Iterator, List, Optional
+from src.core.schema import get_schema
+from src.services.database import DEFAULT_FETCH_SIZE, DEFAULT_POOL_SIZE, Database, build_select
+from .base import DataHandler
+
+logger = logging.getLogger(__name__)
+
+class DatabaseHandler(DataHandler):
+    def __init__(self, connection_string: Optional[str] = None, table: str = "hostages",
+                 pool_size: int = DEFAULT_POOL_SIZE):
+        self.connection_string = connection_string or "sqlite:///data/hostages.db"
+        self.table = table
+        self.db = Database(self.connection_string, pool_size=pool_size)
+
+    def iter_chunks(self, chunksize: int = DEFAULT_FETCH_SIZE, **filters) -> Iterator[pd.DataFrame]:
+        """Query the table with ``filters`` (see build_select) and clean the rows chunk by chunk
+
+        When only some ``columns`` are selected, missing schema columns are not filled in.
+        """
+        sql, params = build_select(self.table, **filters)
+        schema = get_schema(self.schema_name)
+        fill_defaults = self.fill_defaults and not filters.get('columns')
+        offset = 0
+        for chunk in self.db.iter_query(sql, params, chunksize=chunksize):
+            yield schema.clean(chunk, id_offset=offset, fill_defaults=fill_defaults)
+            offset += len(chunk)
+
+    def read_data(self, columns: Optional[List[str]] = None, status: Optional[List[str]] = None,
+                  date_from=None, date_to=None, min_age: Optional[int] = None, max_age: Optional[int] = None,
+                  order_by: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None,
+                  chunksize: int = DEFAULT_FETCH_SIZE) -> pd.DataFrame:
+        """Read and clean database data
+
+        Filters, ordering and limit/offset run in the database, so only the
+        rows a view renders are transferred.
+        """
+        try:
+            chunks = list(self.iter_chunks(
+                chunksize=chunksize, columns=columns, status=status, date_from=date_from,
+                date_to=date_to, min_age=min_age, max_age=max_age, order_by=order_by,
+                limit=limit, offset=offset
+            ))
+            if not chunks:
+                return pd.DataFrame()
+            return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        except Exception as e:
+            logger.error(f"Error reading from database: {str(e)}")
+            return pd.DataFrame()
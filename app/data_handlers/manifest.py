@@ -0,0 +1,103 @@
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+@dataclass
+class FileRecord:
+    name: str
+    size: int
+    mtime: float
+    sha256: str
+
+@dataclass
+class ManifestDiff:
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+class IngestManifest:
+    """Size, mtime and content hash of every file that has been ingested
+
+    Files whose size and mtime are unchanged are trusted without hashing;
+    otherwise the content hash decides, so a file that was only touched is
+    not re-ingested.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records: Dict[str, FileRecord] = {}
+        self._pending: Dict[str, FileRecord] = {}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.records = {name: FileRecord(**record) for name, record in json.load(f).items()}
+        except Exception as e:
+            logger.error(f"Error loading ingest manifest {self.path}: {str(e)}")
+            self.records = {}
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({name: asdict(record) for name, record in self.records.items()}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def diff(self, data_dir: str, filenames: List[str]) -> ManifestDiff:
+        """Compare the files currently in data_dir with the manifest"""
+        result = ManifestDiff()
+        self._pending = {}
+        for name in filenames:
+            path = os.path.join(data_dir, name)
+            stat = os.stat(path)
+            known = self.records.get(name)
+            if known is not None and known.size == stat.st_size and known.mtime == stat.st_mtime:
+                result.unchanged.append(name)
+                continue
+
+            record = FileRecord(name, stat.st_size, stat.st_mtime, file_sha256(path))
+            self._pending[name] = record
+            if known is None:
+                result.added.append(name)
+            elif known.sha256 != record.sha256:
+                result.changed.append(name)
+            else:
+                result.unchanged.append(name)
+
+        result.removed = sorted(set(self.records) - set(filenames))
+        return result
+
+    def apply(self, diff: ManifestDiff, failed: Sequence[str] = ()):
+        """Record the outcome of a diff once its files have been ingested
+
+        Files in ``failed`` are left out (or dropped) so the next diff picks them up again.
+        """
+        for name in list(diff.removed) + list(failed):
+            self.records.pop(name, None)
+        self.records.update({name: record for name, record in self._pending.items() if name not in failed})
+        self._pending = {}
+
+    def clear(self):
+        self.records = {}
+        self._pending = {}
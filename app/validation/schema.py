@@ -1,9 +1,14 @@
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
 import logging
+from src.core.schema import ValidationResult, get_schema
 
 logger = logging.getLogger(__name__)
 
+# Validated columns; the n-th sets bit 1 << n of a row's validation flags when it fails
+VALIDATED_COLUMNS = ('age', 'name', 'location_taken', 'days_in_captivity')
+
 class DataValidator:
     @staticmethod
     def validate_age(value: Any) -> bool:
@@ -37,14 +42,27 @@ class DataValidator:
             'days_in_captivity': self.validate_days_in_captivity(record.get('days_in_captivity', -1))
         }
 
+    def validate_columns(self, df: pd.DataFrame) -> ValidationResult:
+        """Validate every row at once with the hostage schema rules; same verdicts as validate_record"""
+        result = get_schema('hostage').validate(df, columns=VALIDATED_COLUMNS)
+        result.flags = result.flags.astype(np.uint8)
+        return result
+
     def validate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate dataframe and add validation status column"""
+        """Validate dataframe and add validation status and flags columns
+
+        The number of failing rows per column is kept in
+        ``df.attrs['validation_failure_counts']``.
+        """
         try:
-            validation_results = df.apply(self.validate_record, axis=1)
-            df['validation_status'] = validation_results.apply(
-                lambda x: 'valid' if all(x.values()) else 'invalid'
-            )
+            result = self.validate_columns(df)
+            df['validation_status'] = np.where(result.valid, 'valid', 'invalid')
+            df['validation_flags'] = result.flags
+            df.attrs['validation_failure_counts'] = result.failure_counts
+            failing = {column: count for column, count in result.failure_counts.items() if count}
+            if failing:
+                logger.info(f"Validation failures per column: {failing}")
             return df
         except Exception as e:
             logger.error(f"Error validating dataframe: {str(e)}")
-            return df 
\ No newline at end of file
+            return df
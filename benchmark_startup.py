@@ -0,0 +1,116 @@
+"""Measure cold-start import times of the app and its heavy dependencies
+
+Each module is imported in a fresh interpreter with ``-X importtime``, so
+every measurement is a cold import, as after a container restart. Entries
+ending in ``.py`` are scripts such as the Streamlit entry point: they are
+loaded with ``runpy`` (``main()`` does not run) and their import time is how
+long loading them takes.
+
+    python benchmark_startup.py
+    python benchmark_startup.py --repeat 5 --top 15 --json startup.json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MODULES = [
+    'streamlit',
+    'pandas',
+    'plotly.express',
+    'src.services.chart_service',
+    'src.services.data_service',
+    'src.pages.dashboard',
+    'src.pages.data_management',
+    'src.pages.analytics',
+    'src.pages.settings',
+    'app.py'
+]
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+def _load_statement(module: str) -> str:
+    if module.endswith('.py'):
+        return ("import runpy, time; started = time.perf_counter(); "
+                f"runpy.run_path({module!r}, run_name='__benchmark__'); "
+                "print((time.perf_counter() - started) * 1000)")
+    return f'import {module}'
+
+def import_times(module: str) -> Tuple[float, Dict[str, Tuple[float, float]], str]:
+    """Wall time of a cold ``import module`` and the (self, cumulative) ms of every module it loaded"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _load_statement(module)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    wall = (time.perf_counter() - started) * 1000
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            times[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    if module.endswith('.py') and result.returncode == 0:
+        # A script is not an import itself; it reports its own load time on stdout
+        times[module] = (0.0, float(result.stdout.strip().splitlines()[-1]))
+    error = '' if result.returncode == 0 else result.stderr.strip().splitlines()[-1]
+    return wall, times, error
+
+def benchmark(modules: List[str], repeat: int) -> List[Dict]:
+    results = []
+    for module in modules:
+        walls, cumulative, error = [], [], ''
+        for _ in range(repeat):
+            wall, times, error = import_times(module)
+            walls.append(wall)
+            cumulative.append(times.get(module, (0.0, 0.0))[1])
+        results.append({
+            'module': module,
+            'import_ms': round(statistics.median(cumulative), 1),
+            'process_ms': round(statistics.median(walls), 1),
+            'error': error
+        })
+    return results
+
+def slowest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """Modules with the largest self time when importing ``module``"""
+    _, times, _ = import_times(module)
+    ranked = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    return [(name, round(self_ms, 1)) for name, (self_ms, _) in ranked[:top]]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES,
+                        help='modules or .py scripts to load (default: app.py, its pages and heavy dependencies)')
+    parser.add_argument('--repeat', type=int, default=3, help='cold imports per module; the median is reported')
+    parser.add_argument('--top', type=int, default=10, help='slowest individual imports to list for app')
+    parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+    args = parser.parse_args()
+
+    results = benchmark(args.modules, args.repeat)
+    width = max(len(result['module']) for result in results)
+    print(f"{'module':<{width}}  {'import ms':>10}  {'process ms':>10}")
+    for result in results:
+        line = f"{result['module']:<{width}}  {result['import_ms']:>10.1f}  {result['process_ms']:>10.1f}"
+        print(line + (f"  ({result['error']})" if result['error'] else ''))
+
+    slowest = slowest_imports('app.py', args.top) if args.top else []
+    if slowest:
+        print("\nSlowest imports under app (self ms):")
+        for name, self_ms in slowest:
+            print(f"  {self_ms:>8.1f}  {name}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results, 'slowest_app_imports': slowest},
+                      f, indent=2)
+
+if __name__ == '__main__':
+    main()
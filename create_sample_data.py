@@ -1 +1,235 @@
- 
\ No newline at end of file
+"""Generate synthetic hostage records and social media posts for development and load tests
+
+Rows are generated in fixed-size blocks, each from its own random generator
+seeded with (seed, dataset, block number), so the output depends only on the
+seed and the row count, never on the chunk size. Chunks are written as soon
+as they are built, so memory stays bounded by --chunk-size however many rows
+are requested.
+
+    python create_sample_data.py hostages --rows 10000
+    python create_sample_data.py posts --rows 50000000 --format parquet --chunk-size 1000000
+
+Output goes to sample_data/ unless --output is given, so synthetic rows are
+never picked up by the dashboard's csv source by accident. To load them into
+the dashboard, write them into the data directory explicitly:
+
+    python create_sample_data.py hostages --output data/hostages_sample.csv
+"""
+import argparse
+import os
+import time
+from typing import Callable, Dict, Iterator, Optional
+import numpy as np
+import pandas as pd
+
+BLOCK_SIZE = 65_536
+DEFAULT_CHUNK_SIZE = 1_048_576
+DEFAULT_SEED = 42
+# Kept apart from the data directory, whose hostages*.csv files are a live source
+DEFAULT_OUTPUT_DIR = 'sample_data'
+
+START_DATE = pd.Timestamp('2023-10-07')
+END_DATE = pd.Timestamp('2024-12-31')
+
+FIRST_NAMES = np.array([
+    'Noa', 'Yosef', 'Avigail', 'Omer', 'Eden', 'Itay', 'Shiri', 'Ariel', 'Kfir', 'Liri',
+    'Daniel', 'Romi', 'Yarden', 'Agam', 'Naama', 'Hersh', 'Maya', 'Alon', 'Karina', 'Or',
+    'נועה', 'יוסף', 'אביגיל', 'עומר', 'עדן', 'איתי', 'שירי', 'אריאל', 'כפיר', 'לירי',
+    'דניאל', 'רומי', 'ירדן', 'אגם', 'נעמה', 'מאיה', 'אלון', 'קרינה', 'אור', 'טל'
+], dtype=object)
+
+LAST_NAMES = np.array([
+    'Cohen', 'Levi', 'Mizrahi', 'Peretz', 'Biton', 'Dahan', 'Avraham', 'Friedman', 'Katz', 'Azoulay',
+    'Goldberg', 'Shapiro', 'Ben-David', 'Malka', 'Amar', 'Ohana', 'Segal', 'Weiss', 'Berger', 'Hadad',
+    'כהן', 'לוי', 'מזרחי', 'פרץ', 'ביטון', 'דהן', 'אברהם', 'פרידמן', 'כץ', 'אזולאי',
+    'גולדברג', 'שפירא', 'בן דוד', 'מלכה', 'עמר', 'אוחנה', 'סגל', 'וייס', 'ברגר', 'חדד'
+], dtype=object)
+
+# (name, weight); where people were taken from
+LOCATIONS = [
+    ('Kfar Aza', 0.18), ('Nir Oz', 0.22), ("Be'eri", 0.2), ('Nova Festival', 0.2), ('Nahal Oz', 0.06),
+    ('Sderot', 0.04), ('Kissufim', 0.03), ('Holit', 0.02), ('Nir Yitzhak', 0.03), ('Ofakim', 0.02)
+]
+
+# Raw status spellings as the sources publish them, so loading exercises normalization
+STATUSES = [('In Hamas Captivity', 0.45), ('Held', 0.1), ('released', 0.25), ('Released', 0.05),
+            ('Deceased', 0.12), ('status unknown', 0.03)]
+
+CITIZENSHIPS = [('Israel', 0.8), ('Thailand', 0.07), ('USA', 0.04), ('Germany', 0.03), ('Argentina', 0.03),
+                ('France', 0.02), ('Russia', 0.01)]
+
+CITIES = [('Tel Aviv', 0.3), ('Jerusalem', 0.2), ('Haifa', 0.12), ('Beer Sheva', 0.08), ('Sderot', 0.05),
+          ('Ashkelon', 0.06), ('Netanya', 0.06), ('Rishon LeZion', 0.07), ('Eilat', 0.02), ('Nazareth', 0.04)]
+
+HASHTAGS = np.array(['#BringThemHomeNow', '#BringThemHome', '#החזירו_אותם_הביתה', '#HostageDeal', '#Israel',
+                     '#Gaza', '#October7', '#עכשיו', '#IDF', '#Hostages'], dtype=object)
+
+POST_WORDS = np.array([
+    'hostages', 'families', 'rally', 'tonight', 'square', 'deal', 'release', 'news', 'update', 'pray',
+    'home', 'now', 'children', 'support', 'march', 'government', 'negotiations', 'hope', 'waiting', 'days',
+    'חטופים', 'משפחות', 'הפגנה', 'הערב', 'כיכר', 'עסקה', 'שחרור', 'חדשות', 'עדכון', 'תקווה',
+    'הביתה', 'עכשיו', 'ילדים', 'תמיכה', 'צעדה', 'ממשלה', 'מחכים', 'ימים', 'כולם', 'יחד'
+], dtype=object)
+
+# Posts draw their text from a pool of generated sentences, so building a
+# chunk never joins strings row by row
+TEXT_POOL_SIZE = 8192
+HASHTAG_POOL_SIZE = 512
+
+def _choice(rng: np.random.Generator, weighted, size: int) -> np.ndarray:
+    values, weights = zip(*weighted)
+    weights = np.asarray(weights, dtype=float)
+    return rng.choice(len(values), size=size, p=weights / weights.sum())
+
+def _categorical(codes: np.ndarray, weighted) -> pd.Categorical:
+    # Fixed categories keep every chunk's schema identical
+    return pd.Categorical.from_codes(codes, categories=[value for value, _ in weighted])
+
+def _dates(rng: np.random.Generator, size: int, skew: float) -> np.ndarray:
+    """Timestamps between START_DATE and END_DATE, denser near the start for skew > 1"""
+    span = (END_DATE - START_DATE).value
+    offsets = (rng.random(size) ** skew * span).astype(np.int64)
+    return (START_DATE.value + offsets).astype('datetime64[ns]')
+
+def hostage_block(rng: np.random.Generator, start: int, size: int, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    ages = np.clip(np.rint(rng.gamma(4.0, 9.0, size)), 0, 95).astype(np.int16)
+    # Most were taken on October 7th, a few in the following days
+    capture_offsets = np.where(rng.random(size) < 0.97, 0, rng.integers(1, 30, size))
+    capture_dates = (START_DATE + pd.to_timedelta(capture_offsets, unit='D')).to_numpy()
+    days = ((END_DATE - pd.DatetimeIndex(capture_dates)).days).to_numpy(dtype=np.int32)
+    statuses = _choice(rng, STATUSES, size)
+    locations = _choice(rng, LOCATIONS, size)
+    names = pd.Series(FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), size)], dtype='string') + ' ' + \
+        pd.Series(LAST_NAMES[rng.integers(0, len(LAST_NAMES), size)], dtype='string')
+    location_names = _categorical(locations, LOCATIONS)
+    details = 'Taken from ' + pd.Series(location_names).astype('string') + ', age ' + \
+        pd.Series(ages).astype('string')
+    return pd.DataFrame({
+        'id': np.arange(start, start + size, dtype=np.int64),
+        'name': names,
+        'age': ages,
+        'status': _categorical(statuses, STATUSES),
+        'location_taken': location_names,
+        'citizenship': _categorical(_choice(rng, CITIZENSHIPS, size), CITIZENSHIPS),
+        'capture_date': capture_dates,
+        'days_in_captivity': days,
+        'details': details
+    })
+
+def _text_pools(seed: int):
+    """Sentences and hashtag groups that post texts are drawn from, the same for every block"""
+    rng = np.random.default_rng([seed, 1_000_000])
+    lengths = rng.integers(5, 25, TEXT_POOL_SIZE)
+    words = POST_WORDS[rng.integers(0, len(POST_WORDS), int(lengths.sum()))]
+    sentences = np.array([' '.join(chunk) for chunk in np.split(words, np.cumsum(lengths)[:-1])], dtype=object)
+    tag_counts = rng.integers(0, 4, HASHTAG_POOL_SIZE)
+    tags = HASHTAGS[rng.integers(0, len(HASHTAGS), int(tag_counts.sum()))]
+    groups = np.array([' '.join(chunk) for chunk in np.split(tags, np.cumsum(tag_counts)[:-1])], dtype=object)
+    return sentences, groups
+
+_POOLS: Dict[int, tuple] = {}
+
+def post_block(rng: np.random.Generator, start: int, size: int, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    if seed not in _POOLS:
+        _POOLS[seed] = _text_pools(seed)
+    sentences, tag_groups = _POOLS[seed]
+    hashtags = pd.Series(tag_groups[rng.integers(0, len(tag_groups), size)], dtype='string')
+    text = pd.Series(sentences[rng.integers(0, len(sentences), size)], dtype='string')
+    text = text.where(hashtags == '', text + ' ' + hashtags)
+    # Heavy-tailed engagement: most posts get a handful of likes, a few go viral
+    likes = np.floor(rng.pareto(1.2, size) * 10).astype(np.int64)
+    retweets = rng.binomial(likes, 0.15)
+    return pd.DataFrame({
+        'id': np.arange(start, start + size, dtype=np.int64),
+        'text': text,
+        'date': _dates(rng, size, skew=2.0),
+        'likes': likes,
+        'retweets': retweets,
+        'hashtags': hashtags,
+        'city': _categorical(_choice(rng, CITIES, size), CITIES)
+    })
+
+DATASETS: Dict[str, Callable[..., pd.DataFrame]] = {
+    'hostages': hostage_block,
+    'posts': post_block
+}
+
+def generate(dataset: str, rows: int, seed: int = DEFAULT_SEED,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Yield ``rows`` synthetic rows of ``dataset`` in frames of about ``chunk_size`` rows"""
+    build = DATASETS[dataset]
+    dataset_id = list(DATASETS).index(dataset)
+    blocks_per_chunk = max(chunk_size // BLOCK_SIZE, 1)
+    block_count = -(-rows // BLOCK_SIZE)
+    for first in range(0, block_count, blocks_per_chunk):
+        frames = []
+        for block in range(first, min(first + blocks_per_chunk, block_count)):
+            start = block * BLOCK_SIZE
+            rng = np.random.default_rng([seed, dataset_id, block])
+            size = min(BLOCK_SIZE, rows - start)
+            frames.append(build(rng, start, size, seed))
+        yield frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+def write_csv(chunks: Iterator[pd.DataFrame], path: str) -> int:
+    rows = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for chunk in chunks:
+            chunk.to_csv(f, header=rows == 0, index=False, date_format='%Y-%m-%d %H:%M:%S')
+            rows += len(chunk)
+    return rows
+
+def write_parquet(chunks: Iterator[pd.DataFrame], path: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for --format parquet")
+    rows = 0
+    writer: Optional['pq.ParquetWriter'] = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression='snappy')
+            # One row group per chunk
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+WRITERS = {'csv': write_csv, 'parquet': write_parquet}
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('dataset', choices=list(DATASETS))
+    parser.add_argument('--rows', type=positive_int, default=1000, help='number of rows (default: 1000)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='random seed (default: 42)')
+    parser.add_argument('--format', choices=list(WRITERS), default='csv')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'rows generated and written at a time, rounded to {BLOCK_SIZE} (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--output', help=f'output file (default: {DEFAULT_OUTPUT_DIR}/<dataset>_sample.<format>, '
+                                         'outside the data directory the dashboard reads)')
+    args = parser.parse_args()
+
+    path = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"{args.dataset}_sample.{args.format}")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    started = time.perf_counter()
+    rows = WRITERS[args.format](generate(args.dataset, args.rows, args.seed, args.chunk_size), path)
+    elapsed = time.perf_counter() - started
+    if not os.path.exists(path):
+        print(f"No {args.dataset} rows generated, nothing written")
+        return
+    print(f"Wrote {rows:,} {args.dataset} rows to {path} in {elapsed:.1f}s "
+          f"({rows / max(elapsed, 1e-9):,.0f} rows/s, {os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,22 @@
-from .config import Config
-from .interfaces import IDataSource, IDataManager, IChartService
-from .models import Hostage, NewsUpdate
+import importlib
 
-__all__ = ['Config', 'IDataSource', 'IDataManager', 'IChartService', 'Hostage', 'NewsUpdate'] 
\ No newline at end of file
+# Exports are imported on first access, so `from src.core.config import Config`
+# does not pull pandas in through the interfaces and models modules
+_EXPORTS = {
+    'Config': '.config',
+    'IDataSource': '.interfaces',
+    'IDataManager': '.interfaces',
+    'IChartService': '.interfaces',
+    'Hostage': '.models',
+    'NewsUpdate': '.models',
+    'HostageTable': '.models',
+    'NewsUpdateTable': '.models'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 class Config:
     DATA_DIR: str = "data"
     CACHE_DIR: str = "data/cache"
+    CACHE_FORMAT: str = "parquet"
     API_KEY: str = os.getenv('GOV_IL_API_KEY', '')
     API_BASE_URL: str = "https://data.gov.il/api/3/action/"
     
@@ -16,6 +17,7 @@ class Config:
         return cls(
             DATA_DIR=os.getenv('DATA_DIR', 'data'),
             CACHE_DIR=os.getenv('CACHE_DIR', 'data/cache'),
+            CACHE_FORMAT=os.getenv('CACHE_FORMAT', 'parquet'),
             API_KEY=os.getenv('GOV_IL_API_KEY', ''),
             API_BASE_URL=os.getenv('API_BASE_URL', "https://data.gov.il/api/3/action/")
         ) 
\ No newline at end of file
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
 
 @dataclass
 class Hostage:
@@ -61,4 +63,195 @@ class NewsUpdate:
     title: str
     content: str
     source: str
-    date: datetime 
\ No newline at end of file
+    date: datetime 
+
+# Table fields as (name, kind, default). Kinds: 'value' keeps values as they
+# are, 'optional' is a value that defaults to None, 'int' and 'date' are
+# coerced like Hostage.from_dict does for one record.
+HOSTAGE_FIELDS = (
+    ('id', 'value', ''),
+    ('name', 'value', ''),
+    ('age', 'int', 0),
+    ('status', 'value', ''),
+    ('citizenship', 'value', ''),
+    ('location', 'value', ''),
+    ('capture_date', 'date', '2023-10-07'),
+    ('details', 'value', ''),
+    ('military_status', 'value', ''),
+    ('image_url', 'optional', None),
+    ('local_image_path', 'optional', None),
+    ('days_in_captivity', 'optional', None),
+    ('age_group', 'optional', None)
+)
+
+NEWS_UPDATE_FIELDS = (
+    ('id', 'value', ''),
+    ('title', 'value', ''),
+    ('content', 'value', ''),
+    ('source', 'value', ''),
+    ('date', 'date', None)
+)
+
+def _coerce_column(values: Optional[pd.Series], kind: str, default: Any, length: int) -> np.ndarray:
+    """One table column as a NumPy array, with missing values replaced by the field default"""
+    if kind == 'date':
+        fill = pd.Timestamp(default) if default is not None else pd.NaT
+        if values is None:
+            return np.full(length, fill, dtype='datetime64[ns]')
+        dates = values if pd.api.types.is_datetime64_any_dtype(values) else pd.to_datetime(values, errors='coerce')
+        return dates.fillna(fill).to_numpy(dtype='datetime64[ns]')
+    if kind == 'int':
+        if values is None:
+            return np.full(length, default, dtype=np.int64)
+        return pd.to_numeric(values, errors='coerce').fillna(default).to_numpy(dtype=np.int64)
+    if values is None:
+        return np.full(length, default, dtype=object)
+    if values.hasnans:
+        values = values.astype(object).where(values.notna(), default)
+    return values.to_numpy()
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+def _to_datetime(value: np.datetime64) -> Optional[datetime]:
+    return None if np.isnat(value) else pd.Timestamp(value).to_pydatetime()
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'value': _to_python,
+    'optional': _to_python,
+    'int': int,
+    'date': _to_datetime
+}
+
+class RowView:
+    """Read-only view of one row of a columnar table
+
+    Holds only the table and a position; field values are read from the
+    columns when accessed.
+    """
+    __slots__ = ('_table', '_position')
+    FIELDS: Tuple[Tuple[str, str, Any], ...] = ()
+
+    def __init__(self, table: 'ColumnarTable', position: int):
+        self._table = table
+        self._position = position
+
+    def to_dict(self) -> dict:
+        """The row as a dictionary, with dates formatted like Hostage.to_dict"""
+        row = {}
+        for name, kind, _ in self.FIELDS:
+            value = getattr(self, name)
+            row[name] = value.strftime('%Y-%m-%d') if kind == 'date' and value is not None else value
+        return row
+
+    def to_model(self):
+        """Materialize the row as the table's dataclass"""
+        return self._table.MODEL(**{name: getattr(self, name) for name, _, _ in self.FIELDS})
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name, _, _ in self.FIELDS[:2])
+        return f"{type(self).__name__}({fields}, ...)"
+
+def _row_class(name: str, fields: Tuple[Tuple[str, str, Any], ...]) -> type:
+    """RowView subclass with one property per field"""
+    def field_property(field: str, convert: Callable[[Any], Any]) -> property:
+        return property(lambda self: convert(self._table._columns[field][self._position]))
+
+    namespace = {'__slots__': (), 'FIELDS': fields}
+    for field, kind, _ in fields:
+        namespace[field] = field_property(field, _CONVERTERS[kind])
+    return type(name, (RowView,), namespace)
+
+class ColumnarTable:
+    """Records stored as one NumPy array per field
+
+    Conversions to and from frames and records run column at a time; rows
+    are exposed as lazy RowView objects created only when accessed, and can
+    be turned into the dataclass model one at a time with to_model().
+    """
+    FIELDS: Tuple[Tuple[str, str, Any], ...] = ()
+    # Alternative source column names per field, tried in order when the field itself is missing
+    ALIASES: Dict[str, Tuple[str, ...]] = {}
+    MODEL: type = None
+    ROW: type = RowView
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'ColumnarTable':
+        columns = {}
+        for name, kind, default in cls.FIELDS:
+            source = next((col for col in (name,) + cls.ALIASES.get(name, ()) if col in df.columns), None)
+            values = df[source] if source is not None else None
+            columns[name] = _coerce_column(values, kind, default, len(df))
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> 'ColumnarTable':
+        return cls.from_frame(pd.DataFrame.from_records(list(records)))
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({name: self._columns[name] for name, _, _ in self.FIELDS})
+
+    def to_records(self) -> List[dict]:
+        """Rows as dictionaries, with dates formatted like Hostage.to_dict"""
+        names = [name for name, _, _ in self.FIELDS]
+        columns = []
+        for name, kind, _ in self.FIELDS:
+            values = self._columns[name]
+            if kind == 'date':
+                dates = pd.Series(values)
+                columns.append(dates.dt.strftime('%Y-%m-%d').astype(object).where(dates.notna(), None).tolist())
+            else:
+                # tolist() turns NumPy scalars into plain Python values
+                columns.append(values.tolist())
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array of one field"""
+        values = self._columns[name].view()
+        values.flags.writeable = False
+        return values
+
+    def take(self, positions: Union[np.ndarray, List[int], slice]) -> 'ColumnarTable':
+        """Sub-table of the rows at ``positions`` (or a boolean mask)"""
+        return type(self)({name: values[positions] for name, values in self._columns.items()})
+
+    def __len__(self) -> int:
+        return self._length
+
+    def memory_usage(self, deep: bool = True) -> int:
+        """Bytes held by the columns; with ``deep``, including the objects of object columns"""
+        return sum(int(pd.Series(values, copy=False).memory_usage(index=False, deep=deep))
+                   for values in self._columns.values())
+
+    def __getitem__(self, position: Union[int, slice]):
+        if isinstance(position, slice):
+            return self.take(position)
+        position = int(position)
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(f"Row {position} out of range for {self._length} rows")
+        return self.ROW(self, position)
+
+    def __iter__(self) -> Iterator[RowView]:
+        for position in range(self._length):
+            yield self.ROW(self, position)
+
+HostageRow = _row_class('HostageRow', HOSTAGE_FIELDS)
+NewsUpdateRow = _row_class('NewsUpdateRow', NEWS_UPDATE_FIELDS)
+
+class HostageTable(ColumnarTable):
+    FIELDS = HOSTAGE_FIELDS
+    # The normalized snapshot calls the location column location_taken
+    ALIASES = {'location': ('location_taken',)}
+    MODEL = Hostage
+    ROW = HostageRow
+
+class NewsUpdateTable(ColumnarTable):
+    FIELDS = NEWS_UPDATE_FIELDS
+    MODEL = NewsUpdate
+    ROW = NewsUpdateRow
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from .constants import AGE_GROUPS
+from .schema import STATUS_CATEGORIES, STATUS_LOOKUP, get_schema
+
+AGE_GROUP_LABELS = [label for _, _, label in AGE_GROUPS]
+_AGE_GROUP_UPPER = np.array([upper for _, upper, _ in AGE_GROUPS], dtype=float)
+_AGE_GROUP_LOWER = AGE_GROUPS[0][0]
+
+# String columns with at most this share of distinct values are stored as categories
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def normalize_status(status: pd.Series) -> pd.Categorical:
+    """Map raw status strings onto the canonical status categories"""
+    mapped = status.astype(str).str.strip().str.lower().map(STATUS_LOOKUP).fillna('Unknown')
+    return pd.Categorical(mapped, categories=STATUS_CATEGORIES)
+
+def age_group_codes(ages: np.ndarray) -> np.ndarray:
+    """Index into AGE_GROUPS for each age, -1 for missing or out of range ages"""
+    codes = np.searchsorted(_AGE_GROUP_UPPER, ages, side='left')
+    out_of_range = np.isnan(ages) | (ages < _AGE_GROUP_LOWER) | (codes >= len(AGE_GROUPS))
+    return np.where(out_of_range, -1, codes)
+
+def is_normalized_status(status: pd.Series) -> bool:
+    return isinstance(status.dtype, pd.CategoricalDtype) and list(status.cat.categories) == STATUS_CATEGORIES
+
+def _compact_strings(df: pd.DataFrame, exclude: set) -> pd.DataFrame:
+    for col in df.columns:
+        if col in exclude or isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+            if df[col].nunique(dropna=True) <= CATEGORY_MAX_UNIQUE_RATIO * len(df):
+                df[col] = df[col].astype('category')
+    return df
+
+def normalize_hostages(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a raw hostages frame once per fetch
+
+    The hostage schema maps status into a category, parses dates and
+    downcasts age and days_in_captivity to small nullable ints; on top of
+    that age_group is precomputed and repetitive string columns become
+    categories. The input frame is left untouched.
+    """
+    df = get_schema('hostage').clean(df, fill_defaults=False)
+
+    if 'age' in df.columns:
+        codes = age_group_codes(df['age'].to_numpy(dtype=float, na_value=np.nan))
+        df['age_group'] = pd.Categorical.from_codes(codes, categories=AGE_GROUP_LABELS)
+
+    if 'days_in_captivity' not in df.columns and 'capture_date' in df.columns:
+        days = (pd.Timestamp(datetime.now()) - df['capture_date']).dt.days
+        df['days_in_captivity'] = days.astype('Int32')
+
+    return _compact_strings(df, exclude={'id', 'name', 'details', 'image_url', 'local_image_path'})
+
+def normalize_social_posts(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a social media frame once per ingest (dates, counts, engagement)"""
+    df = df.copy()
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        df['hour'] = df['date'].dt.hour.astype('Int8')
+    for col in ('likes', 'retweets'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype('int64')
+    if 'likes' in df.columns and 'retweets' in df.columns:
+        df['total_engagement'] = df['likes'] + df['retweets']
+    return _compact_strings(df, exclude={'id', 'text'})
+
+def snapshot_view(df: pd.DataFrame, version: int) -> pd.DataFrame:
+    """Shallow copy of a shared snapshot tagged with its version
+
+    pandas copies on write (required, from 3.0), so consumers may add,
+    overwrite or edit columns of the copy without the change reaching the
+    snapshot that other sessions read; data is only copied when written.
+    """
+    view = df.copy(deep=False)
+    view.attrs['snapshot_version'] = version
+    return view
@@ -0,0 +1,266 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import threading
+import numpy as np
+import pandas as pd
+from .constants import STATUS_MAPPINGS
+
+STATUS_CATEGORIES = ['Held', 'Released', 'Deceased', 'Unknown']
+
+# Raw status values (lowercased) to canonical labels, including the labels themselves
+STATUS_LOOKUP = {**{label.lower(): label for label in STATUS_CATEGORIES}, **STATUS_MAPPINGS}
+
+# Marker default: fill a missing id column with the row number
+ROW_NUMBER = object()
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Declarative description of one column of a record type
+
+    ``dtype`` is one of 'string', 'category', 'datetime', a pandas numeric
+    dtype name such as 'Int16' or 'float64', or None to keep values as they
+    are. ``min_value``/``max_value`` and ``nullable=False`` are validation
+    rules; ``categories`` is the categorical domain, with ``mapping``
+    translating lowercased raw values onto it.
+    """
+    name: str
+    dtype: Optional[str] = None
+    default: Any = None
+    nullable: bool = True
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    categories: Optional[Tuple[str, ...]] = None
+    mapping: Optional[Dict[str, str]] = field(default=None, hash=False, compare=False)
+
+@dataclass(frozen=True)
+class RecordSchema:
+    name: str
+    fields: Tuple[FieldSpec, ...]
+
+    def compile(self) -> 'CompiledSchema':
+        return CompiledSchema(self)
+
+@dataclass
+class ValidationResult:
+    """Column-wise validation outcome
+
+    ``flags`` holds one bitmask per row (``bits`` maps each validated column
+    to its bit), 0 when the row is valid; ``failure_counts`` is the number of
+    failing rows per column.
+    """
+    flags: np.ndarray
+    failure_counts: Dict[str, int]
+    bits: Dict[str, int]
+
+    @property
+    def valid(self) -> np.ndarray:
+        return self.flags == 0
+
+    def failed(self, column: str) -> np.ndarray:
+        return (self.flags & self.bits[column]) != 0
+
+def standardize_columns(columns: Sequence[Any]) -> List[str]:
+    return [str(col).lower().replace(' ', '_') for col in columns]
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except:
+        return np.nan
+
+def as_float(values: pd.Series) -> np.ndarray:
+    """Vectorized float(value), NaN where float() would raise"""
+    numbers = pd.to_numeric(values, errors='coerce')
+    result = numbers.to_numpy(dtype=float, na_value=np.nan, copy=True)
+    if values.dtype == object:
+        # to_numeric rejects a few spellings float() accepts (e.g. '1_000');
+        # re-check only the values it could not parse
+        retry = np.isnan(result) & values.notna().to_numpy()
+        if retry.any():
+            result[retry] = [_to_float(value) for value in values.to_numpy()[retry]]
+    return result
+
+def non_blank_string(values: pd.Series) -> np.ndarray:
+    """Vectorized isinstance(value, str) and len(value.strip()) > 0"""
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        return np.zeros(len(values), dtype=bool)
+    return (values.str.strip().str.len() > 0).fillna(False).to_numpy(dtype=bool)
+
+class CompiledSchema:
+    """A RecordSchema turned into vectorized clean and validate steps
+
+    The per-field work is decided once here; clean() and validate() then only
+    run column operations.
+    """
+
+    def __init__(self, schema: RecordSchema):
+        self.schema = schema
+        self.fields = {spec.name: spec for spec in schema.fields}
+        self.columns = [spec.name for spec in schema.fields]
+        self._cleaners = [(spec.name, self._cleaner_for(spec)) for spec in schema.fields]
+        self._validators = {spec.name: self._validator_for(spec) for spec in schema.fields}
+        self._validators = {name: check for name, check in self._validators.items() if check is not None}
+        self.read_dtypes = {
+            spec.name: str if spec.dtype == 'string' else 'category'
+            for spec in schema.fields if spec.dtype in ('string', 'category')
+        }
+
+    @staticmethod
+    def _cleaner_for(spec: FieldSpec):
+        dtype = spec.dtype
+        if dtype is None:
+            return None
+        if dtype == 'datetime':
+            return lambda values, fill: pd.to_datetime(values, errors='coerce')
+        if dtype == 'string':
+            def clean_string(values, fill):
+                values = values.astype('string')
+                return values.fillna(spec.default) if fill and spec.default is not None else values
+            return clean_string
+        if dtype == 'category':
+            categories = list(spec.categories) if spec.categories else None
+            def clean_category(values, fill):
+                if categories is not None and isinstance(values.dtype, pd.CategoricalDtype) \
+                        and list(values.cat.categories) == categories:
+                    return values
+                if spec.mapping is not None:
+                    values = values.astype('string').str.strip().str.lower().map(spec.mapping)
+                if spec.default is not None:
+                    values = values.fillna(spec.default)
+                return pd.Series(pd.Categorical(values, categories=categories), index=values.index)
+            return clean_category
+
+        bounds = None
+        if pd.api.types.is_integer_dtype(pd.Series(dtype=dtype)):
+            info = np.iinfo(pd.Series(dtype=dtype).dtype.numpy_dtype)
+            bounds = (info.min, info.max)
+        def clean_numeric(values, fill):
+            numbers = pd.to_numeric(values, errors='coerce')
+            if bounds is not None:
+                # Values that don't fit the integer dtype count as missing
+                numbers = numbers.round().where(numbers.between(*bounds))
+            if fill and spec.default is not None:
+                numbers = numbers.fillna(spec.default)
+            return numbers.astype(dtype)
+        return clean_numeric
+
+    @staticmethod
+    def _validator_for(spec: FieldSpec):
+        if spec.min_value is not None or spec.max_value is not None:
+            low = -np.inf if spec.min_value is None else spec.min_value
+            high = np.inf if spec.max_value is None else spec.max_value
+            def check_range(values):
+                numbers = as_float(values)
+                with np.errstate(invalid='ignore'):
+                    return (numbers >= low) & (numbers <= high)
+            return check_range
+        if spec.categories is not None:
+            allowed = set(spec.categories)
+            return lambda values: values.isin(allowed).to_numpy(dtype=bool)
+        if not spec.nullable:
+            if spec.dtype in ('string', None):
+                return non_blank_string
+            return lambda values: values.notna().to_numpy(dtype=bool)
+        return None
+
+    def clean(self, df: pd.DataFrame, id_offset: int = 0, fill_defaults: bool = True) -> pd.DataFrame:
+        """Standardize column names and coerce each schema column to its dtype
+
+        With ``fill_defaults`` missing columns are added and nulls replaced
+        by the field defaults; without it missing values stay missing. Other
+        columns are passed through. The input frame is not modified.
+        """
+        df = df.copy(deep=False)
+        df.columns = standardize_columns(df.columns)
+        for name, cleaner in self._cleaners:
+            spec = self.fields[name]
+            if name not in df.columns:
+                if not fill_defaults or spec.default is None:
+                    continue
+                if spec.default is ROW_NUMBER:
+                    df[name] = range(id_offset, id_offset + len(df))
+                    continue
+                df[name] = pd.Series(spec.default, index=df.index)
+            if cleaner is not None:
+                df[name] = cleaner(df[name], fill_defaults)
+        return df
+
+    def validate(self, df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> ValidationResult:
+        """Check the validation rules of ``columns`` (default: every rule) for all rows
+
+        A column missing from ``df`` fails every row. Bits are assigned in
+        the order of ``columns``.
+        """
+        columns = list(columns) if columns is not None else list(self._validators)
+        n = len(df)
+        flags = np.zeros(n, dtype=np.uint32)
+        failure_counts = {}
+        bits = {}
+        for i, name in enumerate(columns):
+            bits[name] = 1 << i
+            if name in df.columns:
+                failed = ~self._validators[name](df[name])
+            else:
+                failed = np.ones(n, dtype=bool)
+            flags[failed] |= bits[name]
+            failure_counts[name] = int(failed.sum())
+        return ValidationResult(flags=flags, failure_counts=failure_counts, bits=bits)
+
+    def clean_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """clean() for a single record, returning plain Python values (None for missing)"""
+        row = self.clean(pd.DataFrame([record])).iloc[0]
+        cleaned = {}
+        for name, value in row.items():
+            if pd.api.types.is_scalar(value) and pd.isna(value):
+                value = None
+            elif isinstance(value, np.generic):
+                value = value.item()
+            cleaned[name] = value
+        return cleaned
+
+    def __call__(self, df: pd.DataFrame, id_offset: int = 0) -> Tuple[pd.DataFrame, ValidationResult]:
+        """Clean then validate in one call"""
+        cleaned = self.clean(df, id_offset=id_offset)
+        return cleaned, self.validate(cleaned)
+
+HOSTAGE_SCHEMA = RecordSchema('hostage', (
+    FieldSpec('id', default=ROW_NUMBER),
+    FieldSpec('name', 'string', default='Unknown', nullable=False),
+    FieldSpec('age', 'Int16', default=-1, min_value=0, max_value=120),
+    FieldSpec('location_taken', 'string', default='Unknown', nullable=False),
+    FieldSpec('days_in_captivity', 'Int32', default=-1, min_value=0),
+    FieldSpec('status', 'category', default='Unknown', categories=tuple(STATUS_CATEGORIES), mapping=STATUS_LOOKUP),
+    FieldSpec('capture_date', 'datetime'),
+))
+
+SOCIAL_POST_SCHEMA = RecordSchema('social_post', (
+    FieldSpec('id', default=ROW_NUMBER),
+    FieldSpec('text', 'string', default='', nullable=False),
+    FieldSpec('date', 'datetime', nullable=False),
+    FieldSpec('likes', 'Int64', default=0, min_value=0),
+    FieldSpec('retweets', 'Int64', default=0, min_value=0),
+    FieldSpec('hashtags', 'string', default=''),
+    FieldSpec('city', 'category'),
+))
+
+SCHEMAS: Dict[str, RecordSchema] = {}
+_compiled: Dict[str, CompiledSchema] = {}
+_compile_lock = threading.Lock()
+
+def register_schema(schema: RecordSchema):
+    with _compile_lock:
+        SCHEMAS[schema.name] = schema
+        _compiled.pop(schema.name, None)
+
+def get_schema(name: str) -> CompiledSchema:
+    """Compiled schema for a record type, compiled on first use"""
+    compiled = _compiled.get(name)
+    if compiled is None:
+        with _compile_lock:
+            if name not in SCHEMAS:
+                raise KeyError(f"Unknown record schema: {name}")
+            compiled = _compiled.setdefault(name, SCHEMAS[name].compile())
+    return compiled
+
+register_schema(HOSTAGE_SCHEMA)
+register_schema(SOCIAL_POST_SCHEMA)
@@ -0,0 +1,35 @@
+"""Page registry
+
+Each menu entry maps to a render function in one of the page modules,
+imported by dotted path the first time the page is opened, so a cold start
+only loads the modules (and their dependencies) of the page being shown.
+"""
+import importlib
+from typing import Callable, Dict, Tuple
+
+# (section, item) -> (module, render function)
+PAGES: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ("Dashboard", "Overview"): ("src.pages.dashboard", "render_default_dashboard"),
+    ("Dashboard", "Analytics"): ("src.pages.dashboard", "render_analytics_dashboard"),
+    ("Dashboard", "Reports"): ("src.pages.dashboard", "render_reports_dashboard"),
+    ("Data Management", "Hostages"): ("src.pages.data_management", "render_hostages_management"),
+    ("Data Management", "News Updates"): ("src.pages.data_management", "render_news_management"),
+    ("Data Management", "IDF Data"): ("src.pages.data_management", "render_idf_data_management"),
+    ("Data Management", "Gallery"): ("src.pages.data_management", "render_hostages_gallery"),
+    ("Analytics", "Statistics"): ("src.pages.analytics", "render_statistics"),
+    ("Analytics", "Trends"): ("src.pages.analytics", "render_trends"),
+    ("Analytics", "Export"): ("src.pages.analytics", "render_export_options"),
+    ("Settings", "Profile"): ("src.pages.settings", "render_profile_settings"),
+    ("Settings", "Preferences"): ("src.pages.settings", "render_preferences"),
+    ("Settings", "System"): ("src.pages.settings", "render_system_settings"),
+}
+
+DEFAULT_PAGE = ("Dashboard", "Overview")
+
+def get_page(section: str, item: str) -> Callable[[dict], None]:
+    """Render function of a menu entry; raises KeyError for unknown entries"""
+    module_name, function_name = PAGES[(section, item)]
+    return getattr(importlib.import_module(module_name), function_name)
+
+def render_page(section: str, item: str, services: dict):
+    get_page(section, item)(services)
@@ -0,0 +1,26 @@
+import streamlit as st
+
+def render_statistics(services: dict):
+    st.title("Statistics")
+    data_service = services['data_service']
+    summary = data_service.get_hostages_summary()
+    st.json(summary)
+
+def render_trends(services: dict):
+    st.title("Trends Analysis")
+    data_service = services['data_service']
+    posts = data_service.load_social_posts()
+    if posts.empty:
+        st.info("No social media data available. Add posts*.csv files to the data directory.")
+        return
+
+    from src.visualization.plots import create_social_metrics, create_time_series
+    # Rollups built once per ingest, so the charts don't group the raw posts on every rerun
+    buckets = data_service.get_social_buckets(posts)
+    for fig in (create_time_series(posts, buckets=buckets), create_social_metrics(posts, buckets=buckets)):
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True)
+
+def render_export_options(services: dict):
+    st.title("Export Options")
+    st.info("Export functionality coming soon...")
@@ -0,0 +1,94 @@
+import streamlit as st
+from typing import Dict, List
+from src.ui.renderer import render_update_cards
+from src.utils.helpers import get_language, get_translation
+
+def render_latest_updates(updates: List[Dict], version: int, lang: str):
+    """Render latest updates as cards, with their styles from assets/css/update_cards.css"""
+    st.subheader(get_translation('latest_updates', lang))
+    render_update_cards(updates, version=version, lang=lang)
+
+def render_default_dashboard(services: dict):
+    try:
+        st.markdown("""
+            <div class="main-content">
+                <div class="dashboard-container">
+                    <h1 class="main-header">Hostages Data Dashboard</h1>
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        # Add refresh button
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            if st.button("🔄 Refresh Data"):
+                with st.spinner("Refreshing data..."):
+                    if not services['data_service'].refresh_hostages():
+                        st.warning("Refresh failed, showing the previous data.")
+                st.experimental_rerun()
+        with col2:
+            st.markdown("Click to refresh data")
+        
+        # Get data summaries
+        data_service = services['data_service']
+        
+        with st.spinner("Loading data..."):
+            hostages_summary = data_service.get_hostages_summary()
+            hostages_data = data_service.load_hostages()
+            
+            if hostages_data.empty:
+                st.warning("No hostage data available. Using cached data if available.")
+                return
+        
+        # Display metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Hostages", hostages_summary['total'])
+        with col2:
+            st.metric("Released", hostages_summary['released'], 
+                     delta="+4" if hostages_summary['released'] > 0 else None)
+        with col3:
+            st.metric("Still Held", hostages_summary['held'], 
+                     delta="-4" if hostages_summary['released'] > 0 else None)
+        with col4:
+            st.metric("Deceased", hostages_summary['deceased'])
+        
+        # Display charts
+        if not hostages_data.empty:
+            version = hostages_data.attrs.get('snapshot_version')
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Age Distribution")
+                age_chart = services['chart_service'].create_chart(hostages_data, "age_distribution", version)
+                if age_chart:
+                    st.plotly_chart(age_chart, use_container_width=True)
+            
+            with col2:
+                st.subheader("Status Distribution")
+                status_chart = services['chart_service'].create_chart(hostages_data, "status_pie", version)
+                if status_chart:
+                    st.plotly_chart(status_chart, use_container_width=True)
+
+            render_latest_updates(data_service.get_latest_updates(), version, get_language())
+                    
+    except Exception as e:
+        st.error(f"Error rendering dashboard: {str(e)}")
+        st.info("Please try refreshing the page.")
+
+def render_analytics_dashboard(services: dict):
+    st.title("Analytics Dashboard")
+    data_service = services['data_service']
+    chart_service = services['chart_service']
+    
+    hostages_data = data_service.load_hostages()
+    if not hostages_data.empty:
+        version = hostages_data.attrs.get('snapshot_version')
+        st.plotly_chart(chart_service.create_chart(hostages_data, "age_distribution", version))
+        timeline = data_service.get_status_timeline()
+        st.plotly_chart(chart_service.create_chart(timeline, "status_timeline", version))
+
+def render_reports_dashboard(services: dict):
+    st.title("Reports Dashboard")
+    st.info("Reports functionality coming soon...")
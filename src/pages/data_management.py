@@ -0,0 +1,86 @@
+import streamlit as st
+from typing import TYPE_CHECKING
+from src.core.schema import STATUS_CATEGORIES
+from src.ui.components import PaginatedTable
+
+if TYPE_CHECKING:
+    from src.services.data_service import DataService
+
+HOSTAGES_PAGE_SIZE = 100
+HOSTAGES_SORT_COLUMNS = ['id', 'name', 'age', 'status', 'capture_date', 'location_taken']
+
+def render_hostages_table(data_service: 'DataService', key: str):
+    """Filtered, sorted and paged hostages table; only the visible page is sent to the browser"""
+    query = st.text_input("Search names", key=f"{key}_search")
+    if query:
+        results = data_service.search_hostages(query, limit=HOSTAGES_PAGE_SIZE)
+        st.caption(f"{len(results)} matching records")
+        if not results.empty:
+            st.dataframe(results)
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        status = st.multiselect("Status", STATUS_CATEGORIES, key=f"{key}_status")
+    with col2:
+        min_age, max_age = st.slider("Age", 0, 120, (0, 120), key=f"{key}_age")
+    filters = {'status': status or None}
+    if (min_age, max_age) != (0, 120):
+        filters.update(min_age=min_age, max_age=max_age)
+
+    PaginatedTable(
+        key=f"{key}_table",
+        fetch_page=data_service.get_page,
+        sort_columns=HOSTAGES_SORT_COLUMNS,
+        page_size=HOSTAGES_PAGE_SIZE,
+        default_sort='id'
+    ).render(**filters)
+
+def render_hostages_management(services: dict):
+    st.title("Hostages Management")
+    render_hostages_table(services['data_service'], key="hostages")
+
+def render_news_management(services: dict):
+    st.title("News Management")
+    st.info("News management functionality coming soon...")
+
+def render_idf_data_management(services: dict):
+    st.title("IDF Data Management")
+    render_hostages_table(services['data_service'], key="idf")
+
+GALLERY_PAGE_SIZE = 24
+GALLERY_COLUMNS = 4
+
+def render_hostages_gallery(services: dict):
+    """Render hostages photo gallery, one page of thumbnails at a time"""
+    st.title("Hostages Gallery")
+    
+    data_service = services['data_service']
+    # The page widget is drawn after the query, which needs the page it currently holds
+    hostages_data, total = data_service.get_gallery_page(page=st.session_state.get("gallery_page", 1),
+                                                         page_size=GALLERY_PAGE_SIZE)
+    
+    if total == 0:
+        st.warning("No hostage data available")
+        return
+    
+    pages = (total - 1) // GALLERY_PAGE_SIZE + 1
+    if st.session_state.get("gallery_page", 1) > pages:
+        st.session_state["gallery_page"] = pages
+        hostages_data, total = data_service.get_gallery_page(page=pages, page_size=GALLERY_PAGE_SIZE)
+    st.number_input(f"Page (of {pages})", 1, pages, key="gallery_page")
+    
+    # Create grid of hostage cards
+    cols = st.columns(GALLERY_COLUMNS)
+    for idx, hostage in enumerate(hostages_data.to_dict('records')):
+        with cols[idx % GALLERY_COLUMNS]:
+            image = hostage.get('thumbnail') or hostage.get('image_url')
+            if isinstance(image, str) and image:
+                st.image(image)
+            location = hostage.get('location', hostage.get('location_taken', 'Unknown'))
+            st.markdown(f"""
+                **{hostage.get('name', 'Unknown')}**  
+                Age: {hostage.get('age', 'Unknown')}  
+                Status: {hostage.get('status', 'Unknown')}  
+                Location: {location}
+            """)
@@ -0,0 +1,50 @@
+import streamlit as st
+from src.utils.helpers import LANGUAGES, get_language, get_translation
+
+def render_profile_settings(services: dict):
+    st.title("Profile Settings")
+    st.info("Profile settings coming soon...")
+
+def render_preferences(services: dict):
+    st.title("Preferences")
+    lang = get_language()
+    names = {'en': 'english', 'he': 'hebrew'}
+    # Kept under a plain key too: widget state is dropped on pages that don't draw the widget
+    st.session_state.language = st.radio(get_translation('select_language', lang), LANGUAGES,
+                                         index=LANGUAGES.index(lang),
+                                         format_func=lambda code: get_translation(names[code], lang),
+                                         horizontal=True)
+
+def render_system_settings(services: dict):
+    st.title("System Settings")
+    stats = services['data_service'].get_cache_stats()
+    hostages = stats['hostages']
+    cache = stats['cache']
+
+    st.subheader("Hostages Dataset")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Fresh Hits", hostages['hits'])
+    with col2:
+        st.metric("Stale Hits", hostages['stale_hits'])
+    with col3:
+        st.metric("Blocking Loads", hostages['misses'])
+    with col4:
+        age = hostages['age_seconds']
+        st.metric("Snapshot Age", f"{age // 60} min" if age is not None else "-",
+                  delta="stale" if hostages['is_stale'] else None, delta_color="inverse")
+    if hostages['last_error']:
+        st.warning(f"Last refresh error: {hostages['last_error']}")
+    st.json(hostages)
+
+    st.subheader("Cache")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Memory Hits", cache['memory_hits'])
+    with col2:
+        st.metric("Shared Loads", cache['shared_loads'])
+    with col3:
+        st.metric("Misses", cache['misses'])
+    with col4:
+        st.metric("Memory Used", f"{cache['memory_bytes'] / 1024 / 1024:.1f} MB")
+    st.json(cache)
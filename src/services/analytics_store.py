@@ -0,0 +1,139 @@
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+import pandas as pd
+from src.services.database import SQLitePool, build_select, build_where, quote_identifier
+
+HOSTAGES_TABLE = 'hostages'
+_STAGING_TABLE = 'hostages_staging'
+
+# (index name, indexed expression); each is created when its column exists.
+# LOWER(status) serves build_select's status filter, plain status serves GROUP BY.
+INDEXES = [
+    ('ix_hostages_status', 'status', 'status'),
+    ('ix_hostages_status_lower', 'status', 'LOWER(status)'),
+    ('ix_hostages_capture_date', 'capture_date', 'capture_date'),
+    ('ix_hostages_city', 'city', 'city'),
+    ('ix_hostages_location_taken', 'location_taken', 'location_taken')
+]
+
+GROUPABLE_COLUMNS = {'status', 'age_group', 'city', 'location_taken', 'citizenship', 'source'}
+
+def _to_sql_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Plain SQLite-friendly columns: text for categories and dates, ints for nullable ints"""
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+            values = values.astype(object).where(values.notna(), None)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime('%Y-%m-%d').astype(object).where(values.notna(), None)
+        elif pd.api.types.is_extension_array_dtype(values):
+            values = values.astype(object).where(values.notna(), None)
+        out[str(col)] = values
+    return pd.DataFrame(out, index=df.index)
+
+class AnalyticsStore:
+    """Embedded SQLite copy of the hostages snapshot for small filter and aggregate queries
+
+    load() replaces the table at ingest; pages then ask for counts, groups or
+    one page of rows, so their cost follows the size of the result rather
+    than of the dataset. Readers keep seeing the previous table until a
+    load commits.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4):
+        self.path = path
+        self.pool = SQLitePool(path, size=pool_size)
+        self.loaded_at: Optional[datetime] = None
+        self._columns: List[str] = []
+        self._write_lock = threading.Lock()
+        self._refresh_columns()
+
+    def _refresh_columns(self):
+        with self.pool.connection() as conn:
+            rows = conn.execute(f"PRAGMA table_info({quote_identifier(HOSTAGES_TABLE)})").fetchall()
+        self._columns = [row[1] for row in rows]
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def is_empty(self) -> bool:
+        return not self._columns
+
+    def load(self, df: pd.DataFrame):
+        """Replace the stored snapshot with ``df``"""
+        frame = _to_sql_frame(df)
+        with self._write_lock, self.pool.connection() as conn:
+            frame.to_sql(_STAGING_TABLE, conn, if_exists='replace', index=False, chunksize=10_000)
+            conn.commit()
+            # Swap the tables in one transaction
+            conn.execute('BEGIN')
+            conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(HOSTAGES_TABLE)}")
+            conn.execute(f"ALTER TABLE {quote_identifier(_STAGING_TABLE)} RENAME TO {quote_identifier(HOSTAGES_TABLE)}")
+            for name, column, expression in INDEXES:
+                if column in frame.columns:
+                    conn.execute(f"CREATE INDEX {quote_identifier(name)} ON {quote_identifier(HOSTAGES_TABLE)} ({expression})")
+            conn.commit()
+            conn.execute('ANALYZE')
+        self._columns = list(frame.columns)
+        self.loaded_at = datetime.now()
+
+    def _read(self, sql: str, params: Dict[str, Any]) -> pd.DataFrame:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
+    def query(self, columns: Optional[Sequence[str]] = None, order_by: Optional[str] = None,
+              limit: Optional[int] = None, offset: Optional[int] = None, **filters) -> pd.DataFrame:
+        """Rows matching the status/date/age ``filters`` (see build_select), optionally one page of them"""
+        if self.is_empty():
+            return pd.DataFrame()
+        if columns:
+            columns = [col for col in columns if col in self._columns]
+        if order_by and order_by.lstrip('-') not in self._columns:
+            order_by = None
+        sql, params = build_select(HOSTAGES_TABLE, columns=columns, order_by=order_by,
+                                   limit=limit, offset=offset, **filters)
+        df = self._read(sql, params)
+        if 'capture_date' in df.columns:
+            df['capture_date'] = pd.to_datetime(df['capture_date'], errors='coerce')
+        return df
+
+    def count(self, **filters) -> int:
+        if self.is_empty():
+            return 0
+        where, params = build_where(**filters)
+        with self.pool.connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(HOSTAGES_TABLE)}{where}", params).fetchone()[0]
+
+    def group_counts(self, column: str, **filters) -> Dict[str, int]:
+        """Number of matching rows per value of ``column``"""
+        if column not in GROUPABLE_COLUMNS:
+            raise ValueError(f"Cannot group by {column}")
+        if self.is_empty() or column not in self._columns:
+            return {}
+        where, params = build_where(**filters)
+        col = quote_identifier(column)
+        sql = (f"SELECT {col}, COUNT(*) FROM {quote_identifier(HOSTAGES_TABLE)}{where} "
+               f"GROUP BY {col} ORDER BY COUNT(*) DESC")
+        with self.pool.connection() as conn:
+            return {value if value is not None else 'Unknown': count
+                    for value, count in conn.execute(sql, params).fetchall()}
+
+    def status_timeline(self, **filters) -> pd.DataFrame:
+        """Row counts per capture day and status (columns date, status, count)"""
+        if self.is_empty() or not {'status', 'capture_date'} <= set(self._columns):
+            return pd.DataFrame(columns=['date', 'status', 'count'])
+        where, params = build_where(**filters)
+        condition = f"{where} AND capture_date IS NOT NULL" if where else ' WHERE capture_date IS NOT NULL'
+        sql = (f"SELECT capture_date AS date, status, COUNT(*) AS count FROM {quote_identifier(HOSTAGES_TABLE)}"
+               f"{condition} GROUP BY capture_date, status ORDER BY capture_date")
+        df = self._read(sql, params)
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        return df
+
+    def close(self):
+        self.pool.close()
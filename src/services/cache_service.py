@@ -2,46 +2,213 @@ import os
 import pandas as pd
 from datetime import datetime, timedelta
 import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow ships with streamlit, but keep CSV usable without it
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Key under which cache metadata is stored in the Arrow schema metadata (file footer)
+META_KEY = b'social_pulse'
+
+class StorageFormat(ABC):
+    """On-disk format used by CacheService for a single cached frame"""
+    extension: str = ''
+
+    @abstractmethod
+    def write(self, path: str, data: pd.DataFrame, meta: Dict):
+        pass
+
+    @abstractmethod
+    def read(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        pass
+
+    @abstractmethod
+    def read_meta(self, path: str) -> Optional[Dict]:
+        pass
+
+    def remove(self, path: str):
+        if os.path.exists(path):
+            os.remove(path)
+
+    def save(self, path: str, data: pd.DataFrame, meta: Dict):
+        """Write to a temporary file first so readers never see a partial file"""
+        tmp_path = f"{path}.tmp"
+        try:
+            self.write(tmp_path, data, meta)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+class _ArrowFormat(StorageFormat):
+    """Shared logic for Arrow based formats that keep metadata in the schema"""
+
+    def _to_table(self, data: pd.DataFrame, meta: Dict) -> 'pa.Table':
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        schema_meta = dict(table.schema.metadata or {})
+        schema_meta[META_KEY] = json.dumps(meta).encode('utf-8')
+        return table.replace_schema_metadata(schema_meta)
+
+    @staticmethod
+    def _meta_from_schema(schema: 'pa.Schema') -> Optional[Dict]:
+        raw = (schema.metadata or {}).get(META_KEY)
+        return json.loads(raw) if raw else None
+
+class ParquetFormat(_ArrowFormat):
+    extension = 'parquet'
+
+    def __init__(self, compression: str = 'snappy'):
+        self.compression = compression
+
+    def write(self, path: str, data: pd.DataFrame, meta: Dict):
+        pq.write_table(self._to_table(data, meta), path, compression=self.compression)
+
+    def read(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return pq.read_table(path, columns=columns).to_pandas()
+
+    def read_meta(self, path: str) -> Optional[Dict]:
+        # Only the footer is read here, not the row groups
+        return self._meta_from_schema(pq.read_schema(path))
+
+class FeatherFormat(_ArrowFormat):
+    extension = 'feather'
+
+    def write(self, path: str, data: pd.DataFrame, meta: Dict):
+        feather.write_feather(self._to_table(data, meta), path)
+
+    def read(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return feather.read_table(path, columns=columns).to_pandas()
+
+    def read_meta(self, path: str) -> Optional[Dict]:
+        with pa.memory_map(path) as source:
+            return self._meta_from_schema(pa.ipc.open_file(source).schema)
+
+class CSVFormat(StorageFormat):
+    """Legacy format: CSV data with a separate _meta.json sidecar"""
+    extension = 'csv'
+
+    @staticmethod
+    def _meta_path(path: str) -> str:
+        return f"{os.path.splitext(path)[0]}_meta.json"
+
+    def write(self, path: str, data: pd.DataFrame, meta: Dict):
+        data.to_csv(path, index=False)
+
+    def save(self, path: str, data: pd.DataFrame, meta: Dict):
+        super().save(path, data, meta)
+        with open(self._meta_path(path), 'w') as f:
+            json.dump(meta, f)
+
+    def remove(self, path: str):
+        super().remove(path)
+        super().remove(self._meta_path(path))
+
+    def read(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return pd.read_csv(path, usecols=columns)
+
+    def read_meta(self, path: str) -> Optional[Dict]:
+        meta_path = self._meta_path(path)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r') as f:
+            return json.load(f)
+
+STORAGE_FORMATS = {
+    'parquet': ParquetFormat,
+    'feather': FeatherFormat,
+    'csv': CSVFormat
+}
+
+def get_storage_format(name: str) -> StorageFormat:
+    """Resolve a storage format by name, falling back to CSV without pyarrow"""
+    if name not in STORAGE_FORMATS:
+        raise ValueError(f"Unknown cache format: {name}")
+    if name != 'csv' and pa is None:
+        logger.warning(f"pyarrow is not installed, using csv instead of {name} for the cache")
+        name = 'csv'
+    return STORAGE_FORMATS[name]()
 
 class CacheService:
-    def __init__(self, cache_dir: str):
+    def __init__(self, cache_dir: str, storage_format: str = 'parquet'):
         self.cache_dir = cache_dir
         self.cache_duration = timedelta(hours=1)
+        self.storage = get_storage_format(storage_format)
         os.makedirs(cache_dir, exist_ok=True)
-        
-    def get_cached_data(self, key: str) -> pd.DataFrame:
-        """Get data from cache if it exists and is not expired"""
-        cache_path = os.path.join(self.cache_dir, f"{key}.csv")
-        meta_path = os.path.join(self.cache_dir, f"{key}_meta.json")
-        
-        if not (os.path.exists(cache_path) and os.path.exists(meta_path)):
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.storage.extension}")
+
+    def get_metadata(self, key: str) -> Optional[Dict]:
+        """Get cache metadata (timestamp, rows, columns, schema) without loading the data"""
+        cache_path = self._cache_path(key)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            return self.storage.read_meta(cache_path)
+        except Exception as e:
+            logger.error(f"Error reading cache metadata for {key}: {str(e)}")
             return None
-            
+
+    def keys(self) -> List[str]:
+        """List the keys currently stored on disk"""
+        suffix = f".{self.storage.extension}"
+        return [f[:-len(suffix)] for f in os.listdir(self.cache_dir) if f.endswith(suffix)]
+
+    def get_cached_data(self, key: str, columns: Optional[List[str]] = None,
+                        max_age: Optional[timedelta] = None) -> pd.DataFrame:
+        """Get data from cache if it exists and is not expired
+
+        Pass ``columns`` to load only the columns a page needs, and ``max_age``
+        to override the default cache duration for this key.
+        """
+        meta = self.get_metadata(key)
+        if meta is None:
+            return None
+
         # Check if cache is expired
-        with open(meta_path, 'r') as f:
-            meta = json.load(f)
-            cached_time = datetime.fromisoformat(meta['timestamp'])
-            if datetime.now() - cached_time > self.cache_duration:
-                return None
-        
-        return pd.read_csv(cache_path)
-        
-    def cache_data(self, key: str, data: pd.DataFrame):
-        """Cache data with metadata"""
+        cached_time = datetime.fromisoformat(meta['timestamp'])
+        if datetime.now() - cached_time > (max_age or self.cache_duration):
+            return None
+
+        if columns is not None:
+            columns = [col for col in columns if col in meta['columns']]
+
+        try:
+            return self.storage.read(self._cache_path(key), columns=columns)
+        except Exception as e:
+            logger.error(f"Error reading cache for {key}: {str(e)}")
+            return None
+
+    def cache_data(self, key: str, data: pd.DataFrame, extra_meta: Optional[Dict] = None):
+        """Cache data with metadata
+
+        ``extra_meta`` entries (e.g. HTTP validators) are stored alongside the
+        standard metadata and returned by get_metadata.
+        """
         if data is None or data.empty:
             return
-            
-        cache_path = os.path.join(self.cache_dir, f"{key}.csv")
-        meta_path = os.path.join(self.cache_dir, f"{key}_meta.json")
-        
-        # Save data
-        data.to_csv(cache_path, index=False)
-        
-        # Save metadata
+
         meta = {
             'timestamp': datetime.now().isoformat(),
             'rows': len(data),
-            'columns': list(data.columns)
+            'columns': [str(col) for col in data.columns],
+            'schema': {str(col): str(dtype) for col, dtype in data.dtypes.items()},
+            **(extra_meta or {})
         }
-        with open(meta_path, 'w') as f:
-            json.dump(meta, f) 
\ No newline at end of file
+
+        try:
+            self.storage.save(self._cache_path(key), data, meta)
+        except Exception as e:
+            logger.error(f"Error caching data for {key}: {str(e)}")
+
+    def invalidate(self, key: str):
+        """Remove a cached entry"""
+        self.storage.remove(self._cache_path(key))
@@ -1,13 +1,22 @@
 from src.core.interfaces import IChartService
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-from typing import Optional
+import json
+from typing import TYPE_CHECKING, Dict, Optional
 import streamlit as st
+from src.services.tiered_cache import MemoryLRU
+
+# Plotly takes about a second to import, so it is loaded by the first chart
+# rather than at startup
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+def _figure_size(fig: 'go.Figure') -> int:
+    return len(fig.to_json())
 
 class ChartService(IChartService):
-    def __init__(self):
+    def __init__(self, cache_max_bytes: int = 64 * 1024 * 1024):
+        # Built figures keyed by (dataset version, chart type, filter params)
+        self.figure_cache = MemoryLRU(cache_max_bytes, sizeof=_figure_size)
         self.color_scheme = {
             'primary': '#1f77b4',
             'success': '#51cf66',
@@ -33,8 +42,21 @@ class ChartService(IChartService):
             }
         }
 
-    def create_chart(self, data: pd.DataFrame, chart_type: str) -> Optional[go.Figure]:
-        """Create chart with error handling"""
+    def create_chart(self, data: pd.DataFrame, chart_type: str, version: Optional[int] = None,
+                     params: Optional[Dict] = None) -> Optional['go.Figure']:
+        """Create chart with error handling
+
+        When ``version`` identifies the dataset (e.g. the snapshot version),
+        the figure is cached and reused until the version or ``params``
+        (any filters applied to ``data``) change.
+        """
+        cache_key = None
+        if version is not None:
+            cache_key = f"{version}:{chart_type}:{json.dumps(params or {}, sort_keys=True, default=str)}"
+            cached = self.figure_cache.get(cache_key, None)
+            if cached is not None:
+                return cached
+
         try:
             if data.empty:
                 st.warning("No data available for visualization")
@@ -54,12 +76,16 @@ class ChartService(IChartService):
                 st.error(f"Unknown chart type: {chart_type}")
                 return None
             
-            return method(data)
+            fig = method(data)
+            if fig is not None and cache_key is not None:
+                self.figure_cache.set(cache_key, fig)
+            return fig
         except Exception as e:
             st.error(f"Error creating chart: {str(e)}")
             return None
 
-    def _create_age_distribution(self, df: pd.DataFrame) -> go.Figure:
+    def _create_age_distribution(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.express as px
         if 'age' not in df.columns:
             return None
             
@@ -93,7 +119,8 @@ class ChartService(IChartService):
         
         return fig
 
-    def _create_status_pie(self, df: pd.DataFrame) -> go.Figure:
+    def _create_status_pie(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.graph_objects as go
         if 'status' not in df.columns:
             return None
         
@@ -126,15 +153,21 @@ class ChartService(IChartService):
         
         return fig
 
-    def _create_age_group_bar(self, df: pd.DataFrame) -> go.Figure:
+    def _create_age_group_bar(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.express as px
         if 'age' not in df.columns or 'status' not in df.columns:
             return None
             
-        df['age_group'] = pd.cut(df['age'], bins=[0, 18, 30, 50, 70, 100], 
-                                labels=['0-18', '19-30', '31-50', '51-70', '70+'])
+        # The normalized snapshot already carries age_group; never add it to
+        # the caller's frame
+        if 'age_group' in df.columns:
+            age_group = df['age_group']
+        else:
+            age_group = pd.cut(df['age'], bins=[0, 18, 30, 50, 70, 100], 
+                               labels=['0-18', '19-30', '31-50', '51-70', '70+'])
         
         fig = px.bar(
-            df.groupby(['age_group', 'status']).size().unstack(),
+            df.groupby([age_group, 'status'], observed=True).size().unstack(),
             barmode='group',
             color_discrete_map={
                 'Released': self.color_scheme['success'],
@@ -152,7 +185,9 @@ class ChartService(IChartService):
         
         return fig
 
-    def _create_timeline_combined(self, df: pd.DataFrame) -> go.Figure:
+    def _create_timeline_combined(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         if 'date' not in df.columns or 'status' not in df.columns:
             return None
             
@@ -183,11 +218,16 @@ class ChartService(IChartService):
         
         return fig
 
-    def _create_status_timeline(self, df: pd.DataFrame) -> go.Figure:
+    def _create_status_timeline(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.express as px
         if 'status' not in df.columns or 'date' not in df.columns:
             return None
             
-        status_counts = df.groupby(['date', 'status']).size().reset_index(name='count')
+        if 'count' in df.columns:
+            # Already aggregated, e.g. by the analytics store
+            status_counts = df.groupby(['date', 'status'], observed=True)['count'].sum().reset_index()
+        else:
+            status_counts = df.groupby(['date', 'status'], observed=True).size().reset_index(name='count')
         fig = px.line(
             status_counts,
             x='date',
@@ -197,7 +237,8 @@ class ChartService(IChartService):
         )
         return fig
 
-    def _create_location_map(self, df: pd.DataFrame) -> go.Figure:
+    def _create_location_map(self, df: pd.DataFrame) -> 'go.Figure':
+        import plotly.express as px
         if 'latitude' not in df.columns or 'longitude' not in df.columns:
             return None
             
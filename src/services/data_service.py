@@ -1,132 +1,491 @@
+import numpy as np
 import pandas as pd
 import os
-from datetime import datetime
-from typing import Dict, List
-from src.data.data_sources import IDFDataSource
+import json
+import glob
+import logging
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
 import streamlit as st
-from src.core.models import Hostage
+from src.core.models import HostageTable
+from src.core.normalization import normalize_hostages, normalize_social_posts, snapshot_view
+from src.services.cache_service import CacheService
+from src.services.tiered_cache import TieredCache
+from src.services.refresh_service import BackgroundRefresher
+from src.services.stats_engine import compute_hostage_statistics, empty_statistics
+from src.services.analytics_store import AnalyticsStore
+from src.services.search_index import InvertedIndex, frame_texts
+from src.services.recency_index import RecencyIndex
+from src.services.source_orchestrator import DataSource, SourceOrchestrator
+from src.services.image_service import DEFAULT_THUMBNAIL_SIZE, ImageService
+from src.core.schema import get_schema
+from src.utils.config import AppConfig, DataSourceConfig
+from src.visualization.aggregation import TimeBuckets
+
+# Cache keys; everything derived from the hostages dataset shares the prefix
+HOSTAGES_KEY = 'hostages'
+STATISTICS_KEY = 'hostages_statistics'
+STORE_QUERY_KEY = 'hostages_store'
+SORT_ORDER_KEY = 'hostages_sort_order'
+PAGE_ROWS_KEY = 'hostages_page_rows'
+GALLERY_KEY = 'hostages_gallery'
+TABLE_KEY = 'hostages_table'
+SOCIAL_POSTS_KEY = 'social_posts'
+SOCIAL_BUCKETS_KEY = 'social_posts_buckets'
+
+# Hostage columns covered by name search
+HOSTAGE_SEARCH_COLUMNS = ('name', 'details')
+# Hostage columns shown in update records
+UPDATE_COLUMNS = ('capture_date', 'name', 'details', 'source')
+# Display names of data sources in update records
+SOURCE_LABELS = {'gov': 'IDF'}
+
+logger = logging.getLogger(__name__)
 
 class DataService:
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, cache: Optional[TieredCache] = None, cache_ttl: int = 3600,
+                 max_stale: int = 24 * 3600, sources: Sequence[str] = AppConfig.DATA_SOURCES,
+                 source_config: Optional[DataSourceConfig] = None, analytics_path: Optional[str] = None):
         self.data_dir = data_dir
-        self.idf_source = IDFDataSource()
+        self._idf_source = None
+        self.cache_ttl = cache_ttl
+        self.max_stale = max_stale
+        self.cache = cache or TieredCache(CacheService(os.path.join(data_dir, 'cache')), default_ttl=cache_ttl)
+        self.source_config = source_config or DataSourceConfig()
+        self._csv_handler = None
+        self._api_handler = None
+        self.orchestrator = SourceOrchestrator(self._build_sources(sources))
         os.makedirs(data_dir, exist_ok=True)
+        # Indexed SQLite copy of the snapshot for the pages' filter and aggregate queries
+        self.analytics_store = AnalyticsStore(analytics_path or os.path.join(data_dir, 'analytics.db'))
+        # Name/details search; synced with every ingested snapshot
+        self.hostage_index = InvertedIndex()
+        self._search_rows: Tuple[pd.DataFrame, pd.Index] = (pd.DataFrame(), pd.Index([]))
+        # Update records by capture date; synced with every ingested snapshot
+        self.recency_index = RecencyIndex(render_update, content_columns=UPDATE_COLUMNS)
+        self.image_service = ImageService(os.path.join(data_dir, 'cache', 'thumbnails'))
+        self._thumbnail_lock = threading.Lock()
+        self._thumbnail_thread: Optional[threading.Thread] = None
+        self._thumbnails_pending: Optional[pd.DataFrame] = None
+        self.hostages_refresher = BackgroundRefresher(
+            HOSTAGES_KEY,
+            loader=self._fetch_hostages,
+            ttl=cache_ttl,
+            warm_loader=self._load_hostages_from_disk,
+            on_swap=self._schedule_thumbnails
+        )
 
     def load_hostages(self) -> pd.DataFrame:
-        """Load hostages dataset from IDF source and cache"""
+        """Load hostages dataset from IDF source and cache
+
+        Returns a view of the shared normalized snapshot; columns written on
+        it stay local to the caller.
+        """
         return self._load_hostages_cached()
 
-    @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def _load_hostages_cached(_self) -> pd.DataFrame:  # Note the _self parameter
+    def _load_hostages_cached(self) -> pd.DataFrame:
         try:
-            df = _self.idf_source.fetch_data()
-            if df is None or df.empty:
-                st.warning("No data received from source")
-                return pd.DataFrame()
-            
-            return df
+            snapshot = self.hostages_refresher.get()
+            return snapshot_view(snapshot.data, snapshot.version)
         except Exception as e:
             st.error(f"Error loading hostages data: {str(e)}")
             return pd.DataFrame()
 
-    def get_hostages_summary(self) -> Dict:
-        """Get summary statistics of hostages"""
+    @property
+    def snapshot_version(self) -> int:
+        """Version of the hostages snapshot currently being served"""
+        snapshot = self.hostages_refresher.snapshot
+        return snapshot.version if snapshot else 0
+
+    def _versioned_key(self, key: str) -> str:
+        if self.hostages_refresher.snapshot is None:
+            self._load_hostages_cached()
+        return f"{key}_v{self.snapshot_version}"
+
+    @property
+    def idf_source(self):
+        """IDF data source, imported and created on first fetch rather than at startup"""
+        if self._idf_source is None:
+            from src.data.data_sources import IDFDataSource
+            self._idf_source = IDFDataSource()
+        return self._idf_source
+
+    def _build_sources(self, names: Sequence[str]) -> List[DataSource]:
+        config = self.source_config
+        factories = {
+            'gov': lambda: self.idf_source.fetch_data(),
+            'csv': self._read_csv_source,
+            'api': self._read_api_source if config.API_URL else None
+        }
+        sources = []
+        for name in names:
+            fetch = factories.get(name)
+            if fetch is None:
+                logger.info(f"Data source {name} is not configured, skipping it")
+                continue
+            sources.append(DataSource(
+                name,
+                fetch,
+                timeout=config.SOURCE_TIMEOUTS.get(name, config.SOURCE_TIMEOUT),
+                rate_limit=config.SOURCE_RATE_LIMITS.get(name)
+            ))
+        return sources
+
+    # Source handlers leave defaults unfilled, so normalize_hostages can still
+    # derive values such as days_in_captivity from capture_date
+
+    @property
+    def csv_handler(self):
+        """Incremental reader of the csv source, which only re-parses new or changed files"""
+        if self._csv_handler is None:
+            from app.data_handlers import CSVHandler
+            self._csv_handler = CSVHandler(self.data_dir, state_dir=os.path.join(self.data_dir, 'cache', 'ingest'),
+                                           fill_defaults=False)
+        return self._csv_handler
+
+    @property
+    def api_handler(self):
+        """Handler of the api source: pooled, retrying conditional GETs with streamed JSON parsing"""
+        if self._api_handler is None:
+            from app.data_handlers import APIHandler
+            self._api_handler = APIHandler(self.source_config.API_URL,
+                                           cache_dir=os.path.join(self.data_dir, 'cache', 'api'),
+                                           fill_defaults=False)
+        return self._api_handler
+
+    def _read_csv_source(self) -> pd.DataFrame:
+        return self.csv_handler.read_incremental(self.source_config.CSV_PATTERN)
+
+    def _read_api_source(self) -> pd.DataFrame:
+        return self.api_handler.fetch_data()
+
+    def _fetch_hostages(self) -> pd.DataFrame:
+        # All sources are fetched concurrently; raises if none returned data,
+        # so the previous snapshot keeps being served. Hostages listed by
+        # several sources are kept once, from the first configured source
+        df = self.orchestrator.deduplicate(normalize_hostages(self.orchestrator.fetch_snapshot()))
+        self._load_analytics_store(df)
+        self._sync_search_index(df)
+        self._sync_recency_index(df)
+        if self.cache.disk is not None:
+            self.cache.disk.cache_data(HOSTAGES_KEY, df)
+        return df
+
+    def _load_hostages_from_disk(self) -> Optional[Tuple[pd.DataFrame, datetime]]:
+        """Serve the last persisted snapshot after a restart while a fresh one is fetched"""
+        if self.cache.disk is None:
+            return None
+        meta = self.cache.disk.get_metadata(HOSTAGES_KEY)
+        df = self.cache.disk.get_cached_data(HOSTAGES_KEY, max_age=timedelta(seconds=self.max_stale))
+        if meta is None or df is None:
+            return None
+        df = normalize_hostages(df)
+        if self.analytics_store.is_empty():
+            self._load_analytics_store(df)
+        self._sync_search_index(df)
+        self._sync_recency_index(df)
+        return df, datetime.fromisoformat(meta['timestamp'])
+
+    def _load_analytics_store(self, df: pd.DataFrame):
+        try:
+            self.analytics_store.load(df)
+        except Exception as e:
+            # Pages fall back to empty query results; the snapshot itself is fine
+            logger.error(f"Error loading analytics store: {str(e)}")
+
+    def _sync_search_index(self, df: pd.DataFrame):
+        """Bring the search index up to date with a new snapshot, re-tokenizing only changed rows"""
+        keys = pd.Index(df['id']) if 'id' in df.columns else pd.Index([])
+        if not keys.is_unique or len(keys) != len(df):
+            keys = pd.RangeIndex(len(df))
+        try:
+            indexed, removed = self.hostage_index.sync(list(keys), frame_texts(df, HOSTAGE_SEARCH_COLUMNS))
+            self._search_rows = (df, keys)
+            logger.info(f"Search index: {indexed} rows indexed, {removed} removed")
+        except Exception as e:
+            logger.error(f"Error updating search index: {str(e)}")
+
+    def _sync_recency_index(self, df: pd.DataFrame):
+        try:
+            indexed, removed = self.recency_index.sync_frame(df)
+            logger.info(f"Recency index: {indexed} rows indexed, {removed} removed")
+        except Exception as e:
+            logger.error(f"Error updating recency index: {str(e)}")
+
+    def _schedule_thumbnails(self, snapshot):
+        """Generate the thumbnails of a snapshot on a worker thread once it is being served
+
+        The first load happens on the script thread, so generating them as
+        part of the fetch would hold up the first render. Snapshots swapped in
+        while the worker is busy are coalesced into the latest one.
+        """
+        if 'local_image_path' not in snapshot.data.columns:
+            return
+        with self._thumbnail_lock:
+            self._thumbnails_pending = snapshot.data
+            if self._thumbnail_thread is None:
+                self._thumbnail_thread = threading.Thread(target=self._generate_pending_thumbnails,
+                                                          name='thumbnails', daemon=True)
+                self._thumbnail_thread.start()
+
+    def _generate_pending_thumbnails(self):
+        while True:
+            with self._thumbnail_lock:
+                df, self._thumbnails_pending = self._thumbnails_pending, None
+                if df is None:
+                    self._thumbnail_thread = None
+                    return
+            self._pregenerate_thumbnails(df)
+
+    def _pregenerate_thumbnails(self, df: pd.DataFrame):
+        # Gallery pages create any thumbnail this has not got to yet themselves
+        try:
+            available = self.image_service.pregenerate(df['local_image_path'])
+            logger.info(f"Thumbnails ready for {available} images")
+        except Exception as e:
+            logger.error(f"Error generating thumbnails: {str(e)}")
+
+    def search_hostages(self, query: str, limit: Optional[int] = 50) -> pd.DataFrame:
+        """Hostages whose name or details contain every word of ``query`` (last word as a prefix)"""
+        try:
+            if not len(self.hostage_index):
+                # The index is filled when the first snapshot loads
+                self._load_hostages_cached()
+            df, keys = self._search_rows
+            positions = keys.get_indexer(self.hostage_index.search(query, limit=limit))
+            # Keys indexed from a snapshot that is still being swapped in are skipped
+            return df.iloc[positions[positions >= 0]]
+        except Exception as e:
+            st.error(f"Error searching hostages: {e}")
+            return pd.DataFrame()
+
+    def get_hostage_table(self) -> HostageTable:
+        """The snapshot as a columnar HostageTable, converted once per version"""
+        return self.cache.get_or_load(self._versioned_key(TABLE_KEY),
+                                      lambda: HostageTable.from_frame(self._load_hostages_cached()),
+                                      ttl=self.cache_ttl)
+
+    def _store_query(self, name: str, query, **kwargs):
+        """Run an analytics store query once per snapshot version and arguments"""
+        key = f"{self._versioned_key(STORE_QUERY_KEY)}_{name}_{json.dumps(kwargs, sort_keys=True, default=str)}"
+        return self.cache.get_or_load(key, lambda: query(**kwargs), ttl=self.cache_ttl)
+
+    def get_status_timeline(self, **filters) -> pd.DataFrame:
+        """Hostage counts per capture day and status"""
+        try:
+            return self._store_query('timeline', self.analytics_store.status_timeline, **filters)
+        except Exception as e:
+            st.error(f"Error getting status timeline: {e}")
+            return pd.DataFrame(columns=['date', 'status', 'count'])
+
+    def _sort_order(self, df: pd.DataFrame, sort_by: Optional[str], ascending: bool) -> np.ndarray:
+        """Row positions of the snapshot sorted by one column (missing values last), computed once per version"""
+        if not sort_by or sort_by not in df.columns:
+            return np.arange(len(df))
+
+        def compute():
+            values = df[sort_by].reset_index(drop=True)
+            return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+        key = f"{SORT_ORDER_KEY}_v{df.attrs.get('snapshot_version', 0)}_{sort_by}_{'asc' if ascending else 'desc'}"
+        return self.cache.get_or_load(key, compute, ttl=self.cache_ttl)
+
+    @staticmethod
+    def _filter_mask(df: pd.DataFrame, status: Optional[Sequence[str]] = None, date_from=None, date_to=None,
+                     min_age: Optional[int] = None, max_age: Optional[int] = None) -> Optional[np.ndarray]:
+        """Boolean row mask for the dashboard filters (see build_where), or None when there are none"""
+        mask = np.ones(len(df), dtype=bool)
+        if status:
+            mask &= df['status'].isin(status).to_numpy() if 'status' in df.columns else False
+        if (date_from is not None or date_to is not None) and 'capture_date' in df.columns:
+            dates = df['capture_date']
+            if date_from is not None:
+                mask &= (dates >= pd.Timestamp(date_from)).fillna(False).to_numpy(dtype=bool)
+            if date_to is not None:
+                mask &= (dates <= pd.Timestamp(date_to)).fillna(False).to_numpy(dtype=bool)
+        if (min_age is not None or max_age is not None) and 'age' in df.columns:
+            ages = pd.to_numeric(df['age'], errors='coerce')
+            if min_age is not None:
+                mask &= (ages >= min_age).fillna(False).to_numpy(dtype=bool)
+            if max_age is not None:
+                mask &= (ages <= max_age).fillna(False).to_numpy(dtype=bool)
+        return None if mask.all() else mask
+
+    def get_page(self, sort_by: Optional[str] = None, ascending: bool = True, page: int = 1,
+                 page_size: int = 100, columns: Optional[List[str]] = None,
+                 **filters) -> Tuple[pd.DataFrame, int]:
+        """One page of the sorted, filtered hostages snapshot and the number of matching rows
+
+        The sort permutation of each column is cached per snapshot version, and
+        the filtered ordering per sort and filters, so paging through a table
+        only slices ``page_size`` rows out of the snapshot.
+        """
         try:
-            df = self._load_hostages_cached()  # Use cached method
+            df = self._load_hostages_cached()
             if df.empty:
-                return {
-                    'total': 0,
-                    'released': 0,
-                    'held': 0,
-                    'deceased': 0
-                }
-            
-            # Convert status to lowercase for consistent comparison
-            df['status'] = df['status'].str.lower()
-            
-            return {
-                'total': len(df),
-                'released': len(df[df['status'] == 'released']),
-                'held': len(df[df['status'] == 'held']),
-                'deceased': len(df[df['status'] == 'deceased'])
-            }
+                return pd.DataFrame(), 0
+
+            def compute():
+                order = self._sort_order(df, sort_by, ascending)
+                mask = self._filter_mask(df, **filters)
+                return order if mask is None else order[mask[order]]
+
+            # Keyed on the version of this view, so positions always match the frame they index
+            key = (f"{PAGE_ROWS_KEY}_v{df.attrs.get('snapshot_version', 0)}_{sort_by}_"
+                   f"{'asc' if ascending else 'desc'}_{json.dumps(filters, sort_keys=True, default=str)}")
+            rows = self.cache.get_or_load(key, compute, ttl=self.cache_ttl)
+            start = (max(page, 1) - 1) * page_size
+            result = df.iloc[rows[start:start + page_size]]
+            if columns:
+                result = result[[col for col in columns if col in result.columns]]
+            return result, len(rows)
         except Exception as e:
-            st.error(f"Error getting hostages summary: {e}")
-            return {
-                'total': 0,
-                'released': 0,
-                'held': 0,
-                'deceased': 0
-            }
+            st.error(f"Error loading hostages page: {e}")
+            return pd.DataFrame(), 0
 
-    @st.cache_data(ttl=3600)
-    def get_age_statistics(_self) -> Dict:  # Note the _self parameter
-        """Get detailed age statistics"""
+    def _gallery_index(self) -> pd.DataFrame:
+        """Hostages with the content hash of their local image (None if missing), built once per snapshot"""
+        def compute():
+            df = self._load_hostages_cached()
+            return df.assign(image_digest=self.image_service.build_index(df))
+        return self.cache.get_or_load(self._versioned_key(GALLERY_KEY), compute, ttl=self.cache_ttl)
+
+    def get_gallery_page(self, page: int = 1, page_size: int = 24,
+                         size: str = DEFAULT_THUMBNAIL_SIZE) -> Tuple[pd.DataFrame, int]:
+        """One page of gallery cards with a ``thumbnail`` path per row, and the total number of cards
+
+        Only the thumbnails of this page are looked up, or created if the
+        background refresh has not got to them yet.
+        """
         try:
-            df = _self._load_hostages_cached()
-            if df.empty or 'age' not in df.columns:
-                return {
-                    'average_age': 0,
-                    'median_age': 0,
-                    'min_age': 0,
-                    'max_age': 0
-                }
-            
-            # Convert age to numeric, handling any non-numeric values
-            df['age'] = pd.to_numeric(df['age'], errors='coerce')
-            
-            return {
-                'average_age': df['age'].mean(),
-                'median_age': df['age'].median(),
-                'min_age': df['age'].min(),
-                'max_age': df['age'].max()
-            }
+            index = self._gallery_index()
+            start = (max(page, 1) - 1) * page_size
+            rows = index.iloc[start:start + page_size]
+            paths = rows['local_image_path'] if 'local_image_path' in rows.columns else [None] * len(rows)
+            thumbnails = [
+                self.image_service.thumbnail(path, size, digest=digest) if isinstance(digest, str) else None
+                for path, digest in zip(paths, rows['image_digest'])
+            ]
+            return rows.assign(thumbnail=pd.Series(thumbnails, index=rows.index, dtype=object)), len(index)
         except Exception as e:
-            st.error(f"Error getting age statistics: {e}")
-            return {
-                'average_age': 0,
-                'median_age': 0,
-                'min_age': 0,
-                'max_age': 0
-            }
+            st.error(f"Error loading gallery: {e}")
+            return pd.DataFrame(), 0
+
+    def refresh_hostages(self) -> bool:
+        """Re-fetch the hostages dataset now; the previous snapshot is kept on failure"""
+        return self.hostages_refresher.refresh_now(wait=True)
+
+    def _social_post_files(self) -> Tuple[List[str], int]:
+        """Social posts files in the data directory and a version that changes whenever one does"""
+        paths = sorted(glob.glob(os.path.join(self.data_dir, self.source_config.SOCIAL_PATTERN)))
+        signature = []
+        for path in paths:
+            stat = os.stat(path)
+            signature.append((os.path.basename(path), stat.st_size, stat.st_mtime_ns))
+        return paths, zlib.crc32(json.dumps(signature).encode())
+
+    def _ingest_social_posts(self, paths: List[str], version: int) -> pd.DataFrame:
+        schema = get_schema('social_post')
+        frames = [schema.clean(pd.read_csv(path, dtype=schema.read_dtypes)) for path in paths]
+        if not frames:
+            return pd.DataFrame()
+        df = normalize_social_posts(pd.concat(frames, ignore_index=True))
+        # The engagement rollups are built with the posts, so charts never group the raw rows
+        self.cache.set(f"{SOCIAL_BUCKETS_KEY}_v{version}", TimeBuckets.from_frame(df), ttl=self.cache_ttl)
+        return df
+
+    def load_social_posts(self) -> pd.DataFrame:
+        """Social media posts from the posts*.csv files, ingested once per version of the files"""
+        try:
+            paths, version = self._social_post_files()
+            df = self.cache.get_or_load(f"{SOCIAL_POSTS_KEY}_v{version}",
+                                        lambda: self._ingest_social_posts(paths, version), ttl=self.cache_ttl)
+            return snapshot_view(df, version)
+        except Exception as e:
+            st.error(f"Error loading social media posts: {e}")
+            return pd.DataFrame()
+
+    def get_social_buckets(self, posts: Optional[pd.DataFrame] = None) -> Optional[TimeBuckets]:
+        """Time rollups of the social posts for the engagement charts, or None when there are no posts"""
+        posts = self.load_social_posts() if posts is None else posts
+        if posts.empty or 'date' not in posts.columns:
+            return None
+        # Normally stored by the ingest; rebuilt only if the memory tier evicted it
+        key = f"{SOCIAL_BUCKETS_KEY}_v{posts.attrs.get('snapshot_version', 0)}"
+        return self.cache.get_or_load(key, lambda: TimeBuckets.from_frame(posts), ttl=self.cache_ttl)
+
+    def get_cache_stats(self) -> Dict:
+        """Hit/miss/staleness counters for the system settings page"""
+        return {
+            'hostages': self.hostages_refresher.get_stats(),
+            'sources': self.orchestrator.get_stats(),
+            'cache': self.cache.get_stats()
+        }
 
-    @st.cache_data(ttl=3600)
-    def get_latest_updates(_self, n: int = 5) -> List[Dict]:  # Note the _self parameter
+    def get_hostage_statistics(self) -> Dict:
+        """Status counts, age statistics and age groups, computed once per snapshot"""
+        return self.cache.get_or_load(self._versioned_key(STATISTICS_KEY), self._compute_statistics,
+                                      ttl=self.cache_ttl)
+
+    def _compute_statistics(self) -> Dict:
+        try:
+            return compute_hostage_statistics(self._load_hostages_cached())
+        except Exception as e:
+            st.error(f"Error computing hostage statistics: {e}")
+            return empty_statistics()
+
+    def get_hostages_summary(self) -> Dict:
+        """Get summary statistics of hostages"""
+        return self.get_hostage_statistics()['summary']
+
+    def get_age_statistics(self) -> Dict:
+        """Get detailed age statistics"""
+        return self.get_hostage_statistics()['age_stats']
+
+    def get_age_groups(self) -> Dict:
+        """Get number of hostages per age group"""
+        return self.get_hostage_statistics()['age_groups']
+
+    def _recency(self) -> RecencyIndex:
+        if not len(self.recency_index):
+            # The index is filled when the first snapshot loads
+            self._load_hostages_cached()
+        return self.recency_index
+
+    def get_latest_updates(self, n: int = 5) -> List[Dict]:
         """Get latest hostage updates"""
         try:
-            df = _self._load_hostages_cached()
-            if df.empty:
-                return []
-            
-            # Ensure capture_date is datetime
-            df['capture_date'] = pd.to_datetime(df['capture_date'], errors='coerce')
-            
-            # Sort by capture date and get latest updates
-            df = df.sort_values('capture_date', ascending=False)
-            latest = df.head(n)
-            
-            updates = []
-            for _, row in latest.iterrows():
-                updates.append({
-                    'date': row.get('capture_date', '').strftime('%Y-%m-%d') if pd.notnull(row.get('capture_date')) else '',
-                    'title': f"Update for {row.get('name', 'Unknown')}",
-                    'content': row.get('details', ''),
-                    'source': 'IDF',
-                    'link': '#',
-                    'excerpt': row.get('details', '')[:200] + '...' if row.get('details') else ''
-                })
-            
-            return updates
+            return self._recency().latest(n)
         except Exception as e:
             st.error(f"Error getting latest updates: {e}")
             return []
 
+    def get_latest_updates_by_source(self, n: int = 5) -> Dict[str, List[Dict]]:
+        """The ``n`` latest updates of each data source"""
+        try:
+            return self._recency().latest_per_source(n)
+        except Exception as e:
+            st.error(f"Error getting latest updates: {e}")
+            return {}
+
+    def get_updates_since(self, since: datetime, limit: Optional[int] = None) -> List[Dict]:
+        """Updates dated at or after ``since``, newest first"""
+        try:
+            return self._recency().since(since, limit=limit)
+        except Exception as e:
+            st.error(f"Error getting updates: {e}")
+            return []
+
     def get_statistics(self) -> Dict:
         """Get all statistics in one call"""
         try:
+            statistics = self.get_hostage_statistics()
             return {
-                'summary': self.get_hostages_summary(),
-                'age_stats': self.get_age_statistics(),
+                'summary': statistics['summary'],
+                'age_stats': statistics['age_stats'],
+                'age_groups': statistics['age_groups'],
                 'latest_updates': self.get_latest_updates()
             }
         except Exception as e:
@@ -134,5 +493,22 @@ class DataService:
             return {
                 'summary': {},
                 'age_stats': {},
+                'age_groups': {},
                 'latest_updates': []
-            }
\ No newline at end of file
+            }
+
+def render_update(row: Dict) -> Dict:
+    """Update record shown in the latest updates feed for one hostage row"""
+    date = row.get('capture_date')
+    details = row.get('details')
+    details = details if isinstance(details, str) else ''
+    source = row.get('source')
+    return {
+        'id': row.get('id'),
+        'date': pd.Timestamp(date).strftime('%Y-%m-%d') if pd.notnull(date) else '',
+        'title': f"Update for {row.get('name', 'Unknown')}",
+        'content': details,
+        'source': SOURCE_LABELS.get(source, source) if isinstance(source, str) else 'IDF',
+        'link': '#',
+        'excerpt': details[:200] + '...' if details else ''
+    }
@@ -0,0 +1,192 @@
+import re
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import pandas as pd
+from src.core.schema import STATUS_LOOKUP
+
+try:
+    import sqlalchemy
+except ImportError:
+    sqlalchemy = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_FETCH_SIZE = 10_000
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name; only plain identifiers are accepted"""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return f'"{name}"'
+
+def _sql_date(value: Union[str, date, datetime]) -> str:
+    # ISO strings compare correctly as text, which is how SQLite stores dates
+    ts = pd.Timestamp(value)
+    return ts.strftime('%Y-%m-%d') if ts == ts.normalize() else ts.strftime('%Y-%m-%d %H:%M:%S')
+
+def status_values(statuses: Sequence[str]) -> List[str]:
+    """Every lowercased raw status spelling that normalizes to one of ``statuses``"""
+    wanted = set(statuses)
+    return sorted(raw for raw, label in STATUS_LOOKUP.items() if label in wanted)
+
+def build_where(status: Optional[Sequence[str]] = None, date_from=None, date_to=None,
+                min_age: Optional[int] = None, max_age: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """WHERE clause (empty when there are no filters) and parameters for the dashboard filters
+
+    ``status`` takes canonical labels ('Held', 'Released', ...) and matches
+    every raw spelling of them. Values are always bound as :named
+    parameters, which both sqlite3 and SQLAlchemy accept.
+    """
+    where = []
+    params: Dict[str, Any] = {}
+
+    if status:
+        names = []
+        for i, value in enumerate(status_values(status)):
+            params[f'status_{i}'] = value
+            names.append(f':status_{i}')
+        where.append(f"LOWER(status) IN ({', '.join(names)})" if names else '1 = 0')
+    if date_from is not None:
+        where.append('capture_date >= :date_from')
+        params['date_from'] = _sql_date(date_from)
+    if date_to is not None:
+        where.append('capture_date <= :date_to')
+        params['date_to'] = _sql_date(date_to)
+    if min_age is not None:
+        where.append('age >= :min_age')
+        params['min_age'] = min_age
+    if max_age is not None:
+        where.append('age <= :max_age')
+        params['max_age'] = max_age
+
+    return (' WHERE ' + ' AND '.join(where)) if where else '', params
+
+def build_select(table: str, columns: Optional[Sequence[str]] = None, order_by: Optional[str] = None,
+                 limit: Optional[int] = None, offset: Optional[int] = None,
+                 **filters) -> Tuple[str, Dict[str, Any]]:
+    """Parameterized SELECT with the dashboard ``filters`` (see build_where) pushed into the WHERE clause"""
+    select = ', '.join(quote_identifier(col) for col in columns) if columns else '*'
+    where, params = build_where(**filters)
+    sql = f"SELECT {select} FROM {quote_identifier(table)}{where}"
+    if order_by:
+        descending = order_by.startswith('-')
+        sql += f" ORDER BY {quote_identifier(order_by.lstrip('-'))}{' DESC' if descending else ''}"
+    if limit is not None:
+        sql += ' LIMIT :limit'
+        params['limit'] = int(limit)
+        if offset:
+            sql += ' OFFSET :offset'
+            params['offset'] = int(offset)
+    return sql, params
+
+class SQLitePool:
+    """Fixed-size pool of sqlite3 connections shared across threads"""
+
+    def __init__(self, path: str, size: int = DEFAULT_POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            conn = self._connect() if create else self._idle.get()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+class Database:
+    """Pooled access to a database URL, yielding query results in DataFrame chunks
+
+    ``sqlite:///path`` URLs use a built-in sqlite3 pool; any other URL needs
+    SQLAlchemy, whose engine pools connections itself.
+    """
+
+    def __init__(self, url: str, pool_size: int = DEFAULT_POOL_SIZE):
+        self.url = url
+        if url.startswith('sqlite:///') and sqlalchemy is None:
+            self._pool = SQLitePool(url[len('sqlite:///'):] or ':memory:', size=pool_size)
+            self._engine = None
+        elif sqlalchemy is not None:
+            kwargs = {'pool_pre_ping': True}
+            if not url.startswith('sqlite'):
+                kwargs['pool_size'] = pool_size
+            self._engine = sqlalchemy.create_engine(url, **kwargs)
+            self._pool = None
+        else:
+            raise ImportError(f"SQLAlchemy is required for database URL {url}")
+
+    def iter_query(self, sql: str, params: Optional[Dict[str, Any]] = None,
+                   chunksize: int = DEFAULT_FETCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Run a query and yield its rows ``chunksize`` at a time"""
+        params = params or {}
+        if self._engine is not None:
+            with self._engine.connect() as conn:
+                result = conn.execution_options(stream_results=True).execute(sqlalchemy.text(sql), params)
+                columns = list(result.keys())
+                while True:
+                    rows = result.fetchmany(chunksize)
+                    if not rows:
+                        break
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+            return
+
+        with self._pool.connection() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=columns)
+
+    def execute(self, sql: str, params: Union[Dict[str, Any], Sequence[Dict[str, Any]], None] = None):
+        """Run a statement, or the same statement for each parameter set in a list"""
+        if self._engine is not None:
+            with self._engine.begin() as conn:
+                conn.execute(sqlalchemy.text(sql), params or {})
+            return
+        with self._pool.connection() as conn:
+            if isinstance(params, (list, tuple)):
+                conn.executemany(sql, params)
+            else:
+                conn.execute(sql, params or {})
+
+    def close(self):
+        if self._engine is not None:
+            self._engine.dispose()
+        else:
+            self._pool.close()
@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import threading
+from datetime import timedelta
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urljoin
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.services.cache_service import CacheService
+from src.services.json_stream import DEFAULT_BATCH_SIZE, FrameBuilder, JSONPage
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_POOL_SIZE = 10
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def build_session(pool_size: int = DEFAULT_POOL_SIZE, retries: int = DEFAULT_RETRIES,
+                  backoff_factor: float = DEFAULT_BACKOFF) -> requests.Session:
+    """Session with a keep-alive connection pool and bounded retries with exponential backoff
+
+    Connection errors and RETRY_STATUSES responses to GET/HEAD are retried
+    up to ``retries`` times, honouring Retry-After.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+_shared_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Process-wide pooled session, created on first use"""
+    global _shared_session
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                _shared_session = build_session()
+    return _shared_session
+
+@dataclass
+class FetchResult:
+    data: pd.DataFrame
+    status_code: int
+    not_modified: bool = False
+
+class HTTPClient:
+    """Conditional GET of frames, with the last response kept in the disk cache
+
+    The parsed frame is cached together with the response's ETag and
+    Last-Modified validators. The next fetch of the same URL sends them back
+    as If-None-Match / If-Modified-Since, and a 304 returns the cached frame
+    without downloading or parsing the payload again.
+    """
+
+    def __init__(self, cache: Optional[CacheService] = None, session: Optional[requests.Session] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        self.cache = cache
+        self.session = session or get_session()
+        self.timeout = timeout
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'not_modified': 0, 'downloads': 0}
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        return f"http_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}"
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def _conditional_headers(self, key: str) -> Dict[str, str]:
+        meta = self.cache.get_metadata(key) if self.cache is not None else None
+        validators = (meta or {}).get('http') or {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def fetch(self, url: str, parse: Callable[[requests.Response], pd.DataFrame],
+              params: Optional[Dict] = None, key: Optional[str] = None) -> FetchResult:
+        """GET ``url`` and parse the response into a frame, revalidating any cached copy
+
+        Raises requests exceptions for connection failures and error statuses
+        that remain after retries.
+        """
+        key = key or self.cache_key(requests.Request('GET', url, params=params).prepare().url)
+        headers = self._conditional_headers(key)
+
+        self._count('requests')
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304:
+            # The server has just vouched for the cached copy, however old it is
+            cached = self.cache.get_cached_data(key, max_age=timedelta.max)
+            if cached is not None:
+                self._count('not_modified')
+                return FetchResult(cached, 304, not_modified=True)
+            # Validators outlived the cached frame; fetch the full payload
+            logger.warning(f"Cached copy of {url} is missing, refetching")
+            self._count('requests')
+            response = self.session.get(url, params=params, timeout=self.timeout)
+
+        response.raise_for_status()
+        self._count('downloads')
+        data = parse(response)
+
+        if self.cache is not None:
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            if any(validators.values()):
+                self.cache.cache_data(key, data, extra_meta={'http': validators})
+        return FetchResult(data, response.status_code)
+
+    def fetch_paginated(self, url: str, params: Optional[Dict] = None, records_path: Optional[str] = None,
+                        next_key: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                        clean: Optional[Callable[[pd.DataFrame, int], pd.DataFrame]] = None,
+                        max_pages: Optional[int] = None) -> pd.DataFrame:
+        """Stream every page of a paginated JSON API into one frame
+
+        Each response body is parsed incrementally (see JSONPage) and records
+        are turned into frames ``batch_size`` rows at a time, so the raw page
+        is never held in memory whole. The next page comes from the Link
+        rel="next" header or, failing that, from ``next_key`` in the body.
+        Pages are not cached; use fetch() for conditional requests.
+        """
+        builder = FrameBuilder(batch_size, clean=clean)
+        pages = 0
+        while url and (max_pages is None or pages < max_pages):
+            self._count('requests')
+            with self.session.get(url, params=params, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                self._count('downloads')
+                response.raw.decode_content = True
+                page = JSONPage(response.raw, records_path, next_key)
+                builder.extend(page)
+                next_url = response.links.get('next', {}).get('url') or page.next_url
+                url = urljoin(response.url, next_url) if next_url else None
+            # Next-page URLs carry their own query string
+            params = None
+            pages += 1
+        return builder.build()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
@@ -0,0 +1,119 @@
+import os
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+import pandas as pd
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Longest edge in pixels per thumbnail bucket; every request is served from one of these
+THUMBNAIL_SIZES = {'small': 160, 'medium': 320, 'large': 640}
+DEFAULT_THUMBNAIL_SIZE = 'medium'
+THUMBNAIL_QUALITY = 80
+
+_HASH_CHUNK = 1024 * 1024
+
+class ImageService:
+    """Size-bucketed thumbnails of local images in a content-addressed cache
+
+    Thumbnails are named after a hash of the original's bytes, so a renamed
+    or re-downloaded copy of the same photo reuses them and a changed photo
+    never serves a stale one. Files are hashed once per (path, size, mtime).
+    WebP is used when Pillow supports it, JPEG otherwise.
+    """
+
+    def __init__(self, cache_dir: str, quality: int = THUMBNAIL_QUALITY):
+        self.cache_dir = cache_dir
+        self.quality = quality
+        self.enabled = Image is not None
+        self.format, self.extension = ('WEBP', 'webp') if self.enabled and features.check('webp') else ('JPEG', 'jpg')
+        self._digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        if not self.enabled:
+            logger.info("Pillow is not installed; gallery images are served at full size")
+
+    def digest(self, path: str) -> Optional[str]:
+        """Content hash of the image at ``path``, or None if it does not exist"""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._digests.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with self._lock:
+            self._digests[path] = (signature, digest)
+        return digest
+
+    def thumbnail_path(self, digest: str, size: str = DEFAULT_THUMBNAIL_SIZE) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}_{size}.{self.extension}")
+
+    def thumbnail(self, path: str, size: str = DEFAULT_THUMBNAIL_SIZE, digest: Optional[str] = None) -> Optional[str]:
+        """Path of the ``size`` thumbnail of ``path``, generating it on first use
+
+        Returns the original path when Pillow is unavailable or the image
+        can't be decoded, and None when it does not exist.
+        """
+        if size not in THUMBNAIL_SIZES:
+            raise ValueError(f"Unknown thumbnail size {size}; expected one of {list(THUMBNAIL_SIZES)}")
+        digest = digest or self.digest(path)
+        if digest is None:
+            return None
+        if not self.enabled:
+            return path
+        target = self.thumbnail_path(digest, size)
+        if os.path.exists(target):
+            return target
+        try:
+            self._render(path, target, THUMBNAIL_SIZES[size])
+            return target
+        except Exception as e:
+            logger.error(f"Error creating thumbnail for {path}: {str(e)}")
+            return path
+
+    def _render(self, source: str, target: str, edge: int):
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((edge, edge), Image.LANCZOS)
+            if self.format == 'JPEG' or image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if self.format == 'WEBP' and 'A' in image.getbands() else 'RGB')
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # Write to a temporary name first so readers never see a partial file
+            partial = f"{target}.{threading.get_ident()}.tmp"
+            image.save(partial, self.format, quality=self.quality)
+        os.replace(partial, target)
+
+    def pregenerate(self, paths: Iterable[str], sizes: Iterable[str] = (DEFAULT_THUMBNAIL_SIZE,)) -> int:
+        """Create any missing thumbnails for ``paths``; returns the number of images available"""
+        available = 0
+        for path in dict.fromkeys(path for path in paths if isinstance(path, str) and path):
+            digest = self.digest(path)
+            if digest is None:
+                continue
+            available += 1
+            for size in sizes:
+                self.thumbnail(path, size, digest=digest)
+        return available
+
+    def build_index(self, df: pd.DataFrame, path_column: str = 'local_image_path') -> pd.Series:
+        """Content hash of each row's image (None when missing), stat-ing every distinct path once"""
+        # Built from Python lists: pandas 3 stores None in Series as NaN, which is truthy
+        if path_column not in df.columns:
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        paths = [path if isinstance(path, str) else None for path in df[path_column].tolist()]
+        digests = {path: self.digest(path) for path in set(paths) if path is not None}
+        return pd.Series([digests.get(path) for path in paths], index=df.index, dtype=object)
@@ -0,0 +1,119 @@
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+import pandas as pd
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+DEFAULT_BATCH_SIZE = 10_000
+
+class JSONPage:
+    """Records of one JSON document, parsed incrementally when ijson is installed
+
+    ``records_path`` is the dotted path of the record array ('results',
+    'data.items'), or None for a top-level array. ``next_key`` is the dotted
+    path of the next-page URL in the body, if the API paginates that way;
+    it is available as ``next_url`` once the records have been consumed.
+    Without ijson the whole document is loaded with json.load, so memory is
+    bounded per page rather than per record.
+    """
+
+    def __init__(self, source: BinaryIO, records_path: Optional[str] = None,
+                 next_key: Optional[str] = None):
+        self.source = source
+        self.records_path = records_path
+        self.next_key = next_key
+        self.next_url: Optional[str] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if ijson is not None:
+            return self._iter_streaming()
+        return self._iter_loaded()
+
+    def _iter_streaming(self) -> Iterator[Dict[str, Any]]:
+        item_prefix = f"{self.records_path}.item" if self.records_path else 'item'
+        if not self.next_key:
+            # Records are built by the (usually C) backend itself
+            yield from ijson.items(self.source, item_prefix, use_float=True)
+            return
+
+        # Walk the events to pick up the next-page URL wherever it appears
+        builder = None
+        for prefix, event, value in ijson.parse(self.source, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                # Nested containers have longer prefixes, so this ends the record itself
+                if prefix == item_prefix and event in ('end_map', 'end_array'):
+                    yield builder.value
+                    builder = None
+            elif prefix == item_prefix and event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif self.next_key and prefix == self.next_key and event == 'string':
+                self.next_url = value
+
+    def _iter_loaded(self) -> Iterator[Dict[str, Any]]:
+        body = json.load(self.source)
+        if self.next_key and isinstance(body, dict):
+            self.next_url = _get_path(body, self.next_key)
+        records = _get_path(body, self.records_path) if self.records_path else body
+        yield from records or []
+
+def _get_path(body: Any, path: str) -> Any:
+    for key in path.split('.'):
+        if not isinstance(body, dict):
+            return None
+        body = body.get(key)
+    return body
+
+class FrameBuilder:
+    """Collects records into a frame ``batch_size`` rows at a time
+
+    Only the current batch is held as Python dicts; completed batches are
+    converted to columnar frames (and cleaned, if ``clean`` is given) right
+    away.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE,
+                 clean: Optional[Callable[[pd.DataFrame, int], pd.DataFrame]] = None):
+        self.batch_size = batch_size
+        self.clean = clean
+        self.rows = 0
+        self._batch: List[Dict[str, Any]] = []
+        self._frames: List[pd.DataFrame] = []
+
+    def add(self, record: Dict[str, Any]):
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def _flush(self):
+        if not self._batch:
+            return
+        frame = pd.DataFrame.from_records(self._batch)
+        self._batch = []
+        if self.clean is not None:
+            frame = self.clean(frame, self.rows)
+        self.rows += len(frame)
+        self._frames.append(frame)
+
+    def build(self) -> pd.DataFrame:
+        self._flush()
+        if not self._frames:
+            return pd.DataFrame()
+        frames, self._frames = self._frames, []
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+def read_json_records(path: str, records_path: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                      clean: Optional[Callable[[pd.DataFrame, int], pd.DataFrame]] = None) -> pd.DataFrame:
+    """Load a (possibly very large) JSON export, e.g. of social media posts, in column batches"""
+    builder = FrameBuilder(batch_size, clean=clean)
+    with open(path, 'rb') as f:
+        builder.extend(JSONPage(f, records_path))
+    return builder.build()
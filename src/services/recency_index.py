@@ -0,0 +1,139 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# Past this share of changed or removed rows, sync() re-sorts everything instead of merging
+REBUILD_RATIO = 0.5
+
+class RecencyIndex:
+    """Rows of a snapshot ordered by timestamp, for latest-N and since-T queries
+
+    Timestamps are kept in one sorted int64 array (with keys and sources
+    alongside) and, per source, as positions into it, so a query is a
+    searchsorted plus a slice of k rows. sync() merges only the new or
+    changed rows of each snapshot into the sorted arrays. Records are
+    rendered once per row by ``render`` when first returned and reused
+    until that row changes.
+    """
+
+    def __init__(self, render: Callable[[Dict[str, Any]], Dict], time_column: str = 'capture_date',
+                 key_column: str = 'id', source_column: str = 'source',
+                 content_columns: Optional[Sequence[str]] = None):
+        self.render = render
+        self.time_column = time_column
+        self.key_column = key_column
+        self.source_column = source_column
+        # Columns whose changes re-render a row's record; all columns when None
+        self.content_columns = content_columns
+        self._times = np.empty(0, dtype=np.int64)
+        self._keys = np.empty(0, dtype=object)
+        self._sources = np.empty(0, dtype=object)
+        self._by_source: Dict[Hashable, np.ndarray] = {}
+        self._state = pd.DataFrame({'time': np.empty(0, dtype=np.int64), 'hash': np.empty(0, dtype=np.uint64)})
+        self._columns: Dict[str, np.ndarray] = {}
+        self._row_of = pd.Index([])
+        self._records: Dict[Hashable, Dict] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def _frame_state(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray, pd.Index]:
+        """Timestamp and content hash per key for rows with a timestamp, their sources, and the key of every row"""
+        keys = pd.Index(df[self.key_column]) if self.key_column in df.columns else pd.RangeIndex(len(df))
+        if not keys.is_unique:
+            keys = pd.RangeIndex(len(df))
+        times = pd.to_datetime(df[self.time_column], errors='coerce') if self.time_column in df.columns \
+            else pd.Series(pd.NaT, index=df.index)
+        content = df[[col for col in self.content_columns if col in df.columns]] if self.content_columns else df
+        hashes = pd.util.hash_pandas_object(content, index=False).to_numpy()
+        valid = times.notna().to_numpy()
+        sources = df[self.source_column].astype(object).to_numpy() if self.source_column in df.columns \
+            else np.full(len(df), None, dtype=object)
+        state = pd.DataFrame({
+            'time': times.to_numpy(dtype='datetime64[ns]').astype(np.int64)[valid],
+            'hash': hashes[valid]
+        }, index=keys[valid])
+        return state, sources[valid], keys
+
+    def sync_frame(self, df: pd.DataFrame) -> Tuple[int, int]:
+        """Make the index hold exactly the timestamped rows of ``df``
+
+        Returns the number of (re)indexed and removed rows.
+        """
+        state, sources, keys = self._frame_state(df)
+        with self._lock:
+            previous = self._state.reindex(state.index)
+            unchanged = ((previous['time'] == state['time']) & (previous['hash'] == state['hash'])).to_numpy()
+            changed = ~unchanged
+            # Old entries for changed keys go too, and are re-inserted with their new timestamp
+            dropped = self._state.index.difference(state.index[unchanged])
+
+            if len(self._state) == 0 or changed.sum() + len(dropped) > REBUILD_RATIO * max(len(state), 1):
+                order = np.argsort(state['time'].to_numpy(), kind='stable')
+                self._times = state['time'].to_numpy()[order]
+                self._keys = state.index.to_numpy(dtype=object)[order]
+                self._sources = sources[order]
+                self._records = {}
+            else:
+                keep = ~pd.Index(self._keys).isin(dropped)
+                new_times = state['time'].to_numpy()[changed]
+                order = np.argsort(new_times, kind='stable')
+                new_times = new_times[order]
+                times = self._times[keep]
+                at = np.searchsorted(times, new_times, side='right')
+                self._times = np.insert(times, at, new_times)
+                self._keys = np.insert(self._keys[keep], at, state.index.to_numpy(dtype=object)[changed][order])
+                self._sources = np.insert(self._sources[keep], at, sources[changed][order])
+                for key in dropped:
+                    self._records.pop(key, None)
+
+            self._state = state
+            self._by_source = {
+                source: np.flatnonzero(self._sources == source)
+                for source in pd.unique(self._sources)
+            }
+            self._columns = {col: df[col].to_numpy() for col in df.columns}
+            self._row_of = keys
+            return int(changed.sum()), len(dropped.difference(state.index))
+
+    def _record(self, position: int) -> Dict:
+        key = self._keys[position]
+        record = self._records.get(key)
+        if record is None:
+            row = self._row_of.get_loc(key)
+            record = self._records[key] = self.render({col: values[row] for col, values in self._columns.items()})
+        return record
+
+    def _newest(self, positions: Optional[np.ndarray], start: int, n: Optional[int]) -> List[Dict]:
+        """Records at sorted positions [start, end), newest first, at most ``n`` of them"""
+        end = len(self._times) if positions is None else len(positions)
+        if n is not None:
+            start = max(start, end - n)
+        selected = range(end - 1, start - 1, -1) if positions is None else positions[start:end][::-1]
+        return [self._record(position) for position in selected]
+
+    def latest(self, n: int = 5, source: Optional[Hashable] = None) -> List[Dict]:
+        """The ``n`` most recent records, optionally of one source only"""
+        with self._lock:
+            if source is None:
+                return self._newest(None, 0, n)
+            positions = self._by_source.get(source)
+            return self._newest(positions, 0, n) if positions is not None else []
+
+    def latest_per_source(self, n: int = 5) -> Dict[Hashable, List[Dict]]:
+        with self._lock:
+            return {source: self._newest(positions, 0, n) for source, positions in self._by_source.items()}
+
+    def since(self, timestamp, source: Optional[Hashable] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Records stamped at or after ``timestamp``, newest first"""
+        cutoff = pd.Timestamp(timestamp).value
+        with self._lock:
+            start = int(np.searchsorted(self._times, cutoff, side='left'))
+            if source is None:
+                return self._newest(None, start, limit)
+            positions = self._by_source.get(source)
+            if positions is None:
+                return []
+            return self._newest(positions, int(np.searchsorted(positions, start, side='left')), limit)
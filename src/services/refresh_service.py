@@ -0,0 +1,177 @@
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A fetched dataset together with when it was fetched"""
+    data: Any
+    version: int
+    fetched_at: datetime
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now() - self.fetched_at).total_seconds()
+
+class BackgroundRefresher:
+    """Keeps a dataset fresh from a daemon thread (stale-while-revalidate)
+
+    Readers always get the current snapshot without waiting on the source.
+    The worker re-fetches once ``refresh_ratio * ttl`` seconds have passed
+    and swaps the new snapshot in; if the fetch fails the old snapshot keeps
+    being served and the fetch is retried after ``retry_interval`` seconds.
+    Only the very first read, with nothing to serve yet, blocks on a fetch.
+    ``on_swap`` is called with each new snapshot once it is being served.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any], ttl: float = 3600,
+                 refresh_ratio: float = 0.8, retry_interval: float = 60,
+                 warm_loader: Optional[Callable[[], Optional[Tuple[Any, datetime]]]] = None,
+                 on_swap: Optional[Callable[[Snapshot], None]] = None):
+        self.name = name
+        self.loader = loader
+        self.warm_loader = warm_loader
+        self.on_swap = on_swap
+        self.ttl = ttl
+        self.refresh_ratio = refresh_ratio
+        self.retry_interval = retry_interval
+
+        self._snapshot: Optional[Snapshot] = None
+        self._version = 0
+        self._load_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_attempt: Optional[float] = None
+
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'failures': 0}
+        self.last_error: Optional[str] = None
+        self.last_refresh: Optional[datetime] = None
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    def get(self) -> Snapshot:
+        """Return the current snapshot, loading it only if there is none yet"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self._count('misses')
+            snapshot = self._load_initial()
+        elif snapshot.age_seconds > self.ttl:
+            self._count('stale_hits')
+        else:
+            self._count('hits')
+        self.start()
+        return snapshot
+
+    def _load_initial(self) -> Snapshot:
+        with self._load_lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            warm = self.warm_loader() if self.warm_loader is not None else None
+            snapshot = self._swap(*warm) if warm is not None else self._swap(self.loader(), datetime.now())
+        self._notify(snapshot)
+        return snapshot
+
+    def _swap(self, data: Any, fetched_at: datetime) -> Snapshot:
+        # Called with _load_lock held. The swap is a single reference
+        # assignment, so readers see either the old or the new snapshot whole
+        self._version += 1
+        snapshot = Snapshot(data=data, version=self._version, fetched_at=fetched_at)
+        self._snapshot = snapshot
+        self._next_attempt = None
+        self._wake.set()
+        return snapshot
+
+    def _notify(self, snapshot: Snapshot):
+        # Outside _load_lock, so a slow callback never holds up readers or the next refresh
+        if self.on_swap is None:
+            return
+        try:
+            self.on_swap(snapshot)
+        except Exception as e:
+            logger.error(f"Error in {self.name} swap callback: {str(e)}")
+
+    def refresh(self) -> bool:
+        """Fetch from the source and swap the snapshot in; keeps the old one on failure"""
+        with self._load_lock:
+            try:
+                data = self.loader()
+            except Exception as e:
+                self._count('failures')
+                self.last_error = f"{datetime.now().isoformat(timespec='seconds')}: {str(e)}"
+                self._next_attempt = time.monotonic() + self.retry_interval
+                logger.error(f"Error refreshing {self.name}: {str(e)}")
+                return False
+            snapshot = self._swap(data, datetime.now())
+        self._notify(snapshot)
+        self._count('refreshes')
+        self.last_refresh = datetime.now()
+        return True
+
+    def refresh_now(self, wait: bool = False) -> bool:
+        """Ask the worker to refresh immediately, optionally waiting for the new snapshot"""
+        if not wait:
+            self._next_attempt = time.monotonic()
+            self.start()
+            self._wake.set()
+            return True
+        return self.refresh()
+
+    def _seconds_until_refresh(self) -> float:
+        if self._next_attempt is not None:
+            return self._next_attempt - time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is None:
+            return 0
+        return self.ttl * self.refresh_ratio - snapshot.age_seconds
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self._seconds_until_refresh()
+            if delay > 0:
+                self._wake.wait(timeout=delay)
+                self._wake.clear()
+                continue
+            self.refresh()
+
+    def start(self):
+        """Start the background worker if it is not running yet"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._stats_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"refresh-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        snapshot = self._snapshot
+        stats.update({
+            'version': snapshot.version if snapshot else None,
+            'fetched_at': snapshot.fetched_at.isoformat(timespec='seconds') if snapshot else None,
+            'age_seconds': round(snapshot.age_seconds) if snapshot else None,
+            'is_stale': snapshot.age_seconds > self.ttl if snapshot else None,
+            'last_refresh': self.last_refresh.isoformat(timespec='seconds') if self.last_refresh else None,
+            'last_error': self.last_error,
+            'worker_alive': self._thread is not None and self._thread.is_alive()
+        })
+        return stats
@@ -0,0 +1,294 @@
+import re
+import threading
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# Prefixes shorter than this only match whole terms, so one keystroke doesn't union half the vocabulary
+MIN_PREFIX_LENGTH = 2
+# Rebuild postings without deleted documents once they make up this share of the index
+COMPACT_RATIO = 0.25
+# Expanded prefixes kept between lookups; cleared whenever the index changes
+PREFIX_CACHE_SIZE = 256
+
+_FINAL_LETTERS = {'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ'}
+# Hebrew punctuation (maqaf, paseq, sof pasuq, nun hafukha) separates words
+_HEBREW_SEPARATORS = re.compile('[\u05be\u05c0\u05c3\u05c6]')
+# Niqqud and cantillation marks, plus geresh/gershayim and quotes inside acronyms (צה"ל, ג'ורג')
+_DROPPED = re.compile('[\u0591-\u05c7\u05f3\u05f4"\'\u2019]')
+
+_TOKEN = re.compile(r'\w+')
+_DOC_SEPARATOR = '\x1e'
+_BULK_TOKEN = re.compile(r'\w+|\x1e')
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop niqqud and quotes, and map Hebrew final letters to their base form"""
+    # Regex passes and str.replace stay fast on long strings, unlike a dict-based translate()
+    text = _DROPPED.sub('', _HEBREW_SEPARATORS.sub(' ', text.lower()))
+    for final, base in _FINAL_LETTERS.items():
+        text = text.replace(final, base)
+    return text
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not isinstance(text, str) or not text:
+        return []
+    return _TOKEN.findall(normalize_text(text))
+
+class InvertedIndex:
+    """In-memory term -> document postings with prefix search
+
+    Documents are identified by caller keys (e.g. hostage ids). Postings are
+    compact int64 arrays of internal document numbers in increasing order,
+    so multi-term queries are sorted-array intersections; a sorted term list
+    answers prefix queries with two bisects. Updating or removing a document
+    tombstones its old postings, which are compacted away once they pile up.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, array] = {}
+        self._terms: List[str] = []
+        self._keys: List[Hashable] = []
+        self._doc_of: Dict[Hashable, int] = {}
+        self._fingerprints: Dict[Hashable, int] = {}
+        self._deleted: set = set()
+        self._deleted_docs: Optional[np.ndarray] = None
+        self._prefix_cache: Dict[str, np.ndarray] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._postings)
+
+    def _changed(self):
+        self._deleted_docs = None
+        self._prefix_cache.clear()
+
+    def _add(self, key: Hashable, text: str):
+        self._changed()
+        doc = len(self._keys)
+        self._keys.append(key)
+        self._doc_of[key] = doc
+        self._fingerprints[key] = hash(text)
+        new_terms = []
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = array('q')
+                new_terms.append(term)
+            postings.append(doc)
+        if len(new_terms) > 64:
+            self._terms = sorted(self._postings)
+        else:
+            for term in new_terms:
+                insort(self._terms, term)
+
+    def _remove(self, key: Hashable):
+        doc = self._doc_of.pop(key, None)
+        if doc is not None:
+            self._changed()
+            self._fingerprints.pop(key, None)
+            self._deleted.add(doc)
+
+    def _bulk_add(self, keys: Sequence[Hashable], texts: Sequence[str]):
+        """Index many new documents at once
+
+        All texts are normalized and tokenized as one string, with the ASCII record
+        separator marking document boundaries, then postings are built by sorting
+        term codes instead of appending one posting at a time.
+        """
+        self._changed()
+        first = len(self._keys)
+        joined = _DOC_SEPARATOR.join(texts)
+        tokens = np.array(_BULK_TOKEN.findall(normalize_text(joined)), dtype=object)
+        is_separator = tokens == _DOC_SEPARATOR
+        if int(is_separator.sum()) != len(texts) - 1:
+            # A text contains the separator itself; fall back to one document at a time
+            for key, text in zip(keys, texts):
+                self._add(key, text)
+            return
+
+        docs = first + np.cumsum(is_separator)[~is_separator]
+        codes, terms = pd.factorize(tokens[~is_separator])
+        # A stable sort keeps each term's documents in increasing order
+        order = np.argsort(codes, kind='stable')
+        codes, docs = codes[order], docs[order]
+        # Drop repeats of a term within one document
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (docs[1:] != docs[:-1])
+        codes, docs = codes[keep], docs[keep]
+        if len(codes):
+            bounds = np.flatnonzero(np.diff(codes)) + 1
+            for code, term_docs in zip(codes[np.r_[0, bounds]], np.split(docs, bounds)):
+                term = terms[code]
+                postings = self._postings.get(term)
+                if postings is None:
+                    self._postings[term] = array('q', term_docs.tobytes())
+                else:
+                    postings.frombytes(term_docs.tobytes())
+            self._terms = sorted(self._postings)
+
+        self._keys.extend(keys)
+        self._doc_of.update(zip(keys, range(first, first + len(keys))))
+        self._fingerprints.update(zip(keys, map(hash, texts)))
+
+    def upsert(self, key: Hashable, text: Optional[str]):
+        """Index ``text`` under ``key``, replacing an earlier version if its text changed"""
+        text = text if isinstance(text, str) else ''
+        with self._lock:
+            if key in self._doc_of:
+                if self._fingerprints.get(key) == hash(text):
+                    return
+                self._remove(key)
+            self._add(key, text)
+            self._maybe_compact()
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            self._remove(key)
+            self._maybe_compact()
+
+    def sync(self, keys: Sequence[Hashable], texts: Sequence[Optional[str]]) -> Tuple[int, int]:
+        """Make the index hold exactly these documents
+
+        Only new documents and documents whose text changed are tokenized;
+        keys that are no longer present are removed. Returns the number of
+        (re)indexed and removed documents.
+        """
+        with self._lock:
+            seen = set()
+            new_keys, new_texts = [], []
+            for key, text in zip(keys, texts):
+                seen.add(key)
+                text = text if isinstance(text, str) else ''
+                if key in self._doc_of:
+                    if self._fingerprints.get(key) == hash(text):
+                        continue
+                    self._remove(key)
+                new_keys.append(key)
+                new_texts.append(text)
+            if len(new_keys) > 1000:
+                self._bulk_add(new_keys, new_texts)
+            else:
+                for key, text in zip(new_keys, new_texts):
+                    self._add(key, text)
+            indexed = len(new_keys)
+            stale = [key for key in self._doc_of if key not in seen]
+            for key in stale:
+                self._remove(key)
+            self._maybe_compact()
+            return indexed, len(stale)
+
+    def _maybe_compact(self):
+        if len(self._deleted) <= COMPACT_RATIO * max(len(self._keys), 1):
+            return
+        deleted = np.fromiter(self._deleted, dtype=np.int64)
+        remap = np.full(len(self._keys), -1, dtype=np.int64)
+        live = np.ones(len(self._keys), dtype=bool)
+        live[deleted] = False
+        remap[live] = np.arange(int(live.sum()))
+
+        postings = {}
+        for term, docs in self._postings.items():
+            docs = remap[np.frombuffer(docs, dtype=np.int64)]
+            docs = docs[docs >= 0]
+            if len(docs):
+                postings[term] = array('q', docs.tobytes())
+        self._postings = postings
+        self._terms = sorted(postings)
+        self._keys = [key for key, alive in zip(self._keys, live) if alive]
+        self._doc_of = {key: doc for doc, key in enumerate(self._keys)}
+        self._deleted = set()
+        self._changed()
+
+    def _docs_for(self, token: str, prefix: bool) -> np.ndarray:
+        if not prefix or len(token) < MIN_PREFIX_LENGTH:
+            postings = self._postings.get(token)
+            return np.frombuffer(postings, dtype=np.int64) if postings is not None else np.empty(0, dtype=np.int64)
+        cached = self._prefix_cache.get(token)
+        if cached is not None:
+            return cached
+        start = bisect_left(self._terms, token)
+        end = bisect_left(self._terms, token + '\uffff', lo=start)
+        matches = [np.frombuffer(self._postings[term], dtype=np.int64) for term in self._terms[start:end]]
+        if not matches:
+            docs = np.empty(0, dtype=np.int64)
+        else:
+            docs = matches[0] if len(matches) == 1 else np.unique(np.concatenate(matches))
+        if len(self._prefix_cache) >= PREFIX_CACHE_SIZE:
+            self._prefix_cache.clear()
+        self._prefix_cache[token] = docs
+        return docs
+
+    def _live(self, docs: np.ndarray) -> np.ndarray:
+        if not self._deleted or not len(docs):
+            return docs
+        if self._deleted_docs is None:
+            self._deleted_docs = np.sort(np.fromiter(self._deleted, dtype=np.int64))
+        return docs[~np.isin(docs, self._deleted_docs, assume_unique=True)]
+
+    @staticmethod
+    def _contains(postings: np.ndarray, docs: np.ndarray) -> np.ndarray:
+        positions = np.minimum(np.searchsorted(postings, docs), len(postings) - 1)
+        return postings[positions] == docs if len(postings) else np.zeros(len(docs), dtype=bool)
+
+    def search(self, query: str, limit: Optional[int] = None, prefix: bool = True) -> List[Hashable]:
+        """Keys of documents containing every query term
+
+        With ``prefix`` the last term also matches longer words, as while
+        typing. Results are in indexing order.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        with self._lock:
+            # Rarest terms first keeps the intermediate results small
+            candidates = sorted(
+                (self._docs_for(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)),
+                key=len
+            )
+            driver, others = candidates[0], candidates[1:]
+            if limit is None:
+                for other in others:
+                    driver = driver[self._contains(other, driver)]
+                docs = self._live(driver)
+            else:
+                # Walk the rarest postings in blocks and stop once ``limit`` hits are found,
+                # so common terms cost O(limit * log n) rather than a full intersection
+                found = []
+                count = 0
+                block = max(4 * limit, 1024)
+                for start in range(0, len(driver), block):
+                    chunk = driver[start:start + block]
+                    for other in others:
+                        chunk = chunk[self._contains(other, chunk)]
+                    chunk = self._live(chunk)
+                    found.append(chunk)
+                    count += len(chunk)
+                    if count >= limit:
+                        break
+                docs = np.concatenate(found)[:limit] if found else driver[:0]
+            return [self._keys[doc] for doc in docs]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, key_column: str, text_columns: Iterable[str]) -> 'InvertedIndex':
+        index = cls()
+        index.sync_frame(df, key_column, text_columns)
+        return index
+
+    def sync_frame(self, df: pd.DataFrame, key_column: str, text_columns: Iterable[str]) -> Tuple[int, int]:
+        """sync() with the text of ``text_columns`` joined per row of ``df``"""
+        return self.sync(df[key_column].tolist(), frame_texts(df, text_columns))
+
+def frame_texts(df: pd.DataFrame, text_columns: Iterable[str]) -> List[str]:
+    columns = [col for col in text_columns if col in df.columns]
+    if not columns:
+        return [''] * len(df)
+    text = df[columns[0]].astype(object).where(df[columns[0]].notna(), '').astype(str)
+    for col in columns[1:]:
+        text = text + ' ' + df[col].astype(object).where(df[col].notna(), '').astype(str)
+    return text.tolist()
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_TIMEOUT = 20.0
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` calls per ``per`` seconds
+
+    The bucket is guarded by a thread lock rather than an asyncio lock, so one
+    limiter keeps working across the event loops of successive fetches.
+    """
+
+    def __init__(self, rate: int = 1, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens * self.per / self.rate
+
+    async def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+@dataclass
+class DataSource:
+    """One named source of hostage records
+
+    ``fetch`` is a blocking callable returning a frame; it runs on a worker
+    thread. ``rate_limit`` is (calls, seconds), or None for no limit.
+    """
+    name: str
+    fetch: Callable[[], pd.DataFrame]
+    timeout: float = DEFAULT_SOURCE_TIMEOUT
+    rate_limit: Optional[tuple] = None
+
+@dataclass
+class SourceResult:
+    name: str
+    data: pd.DataFrame
+    elapsed: float
+    error: Optional[str] = None
+    stale: bool = False
+
+class SourceOrchestrator:
+    """Fetch every configured source concurrently and merge them into one frame
+
+    Each source gets its own timeout and rate limit, so the merged snapshot
+    costs the latency of the slowest source that answers in time rather than
+    the sum of all of them. A source that fails or times out contributes its
+    last good frame (marked stale) instead of holding up the others.
+
+    Sources take precedence in the order they are configured: once the
+    merged frame is normalized, deduplicate() keeps each hostage from the
+    first source that lists it.
+    """
+
+    def __init__(self, sources: Sequence[DataSource], max_workers: Optional[int] = None):
+        self.sources = list(sources)
+        self._limiters = {
+            source.name: RateLimiter(*source.rate_limit)
+            for source in self.sources if source.rate_limit is not None
+        }
+        # A dedicated pool: a fetch that overruns its timeout can't be killed
+        # and would otherwise tie up the event loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(len(self.sources), 1) * 2,
+                                            thread_name_prefix='source-fetch')
+        self._last_good: Dict[str, pd.DataFrame] = {}
+        self._last_results: Dict[str, SourceResult] = {}
+        self._lock = threading.Lock()
+
+    async def _fetch_source(self, source: DataSource) -> SourceResult:
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+
+        async def run():
+            limiter = self._limiters.get(source.name)
+            if limiter is not None:
+                await limiter.acquire()
+            return await loop.run_in_executor(self._executor, source.fetch)
+
+        try:
+            # The timeout covers waiting for the rate limiter as well
+            data = await asyncio.wait_for(run(), timeout=source.timeout)
+            if data is None:
+                data = pd.DataFrame()
+            with self._lock:
+                self._last_good[source.name] = data
+            return SourceResult(source.name, data, time.monotonic() - started)
+        except Exception as e:
+            error = f"timed out after {source.timeout}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+            logger.error(f"Error fetching source {source.name}: {error}")
+            with self._lock:
+                fallback = self._last_good.get(source.name)
+            return SourceResult(
+                source.name,
+                fallback if fallback is not None else pd.DataFrame(),
+                time.monotonic() - started,
+                error=error,
+                stale=fallback is not None
+            )
+
+    async def fetch_all_async(self) -> Dict[str, SourceResult]:
+        results = await asyncio.gather(*(self._fetch_source(source) for source in self.sources))
+        results = {result.name: result for result in results}
+        with self._lock:
+            self._last_results = results
+        return results
+
+    def fetch_all(self) -> Dict[str, SourceResult]:
+        """Blocking wrapper around fetch_all_async for the script and refresher threads"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_all_async())
+        # Called from inside a running loop: run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.fetch_all_async()).result()
+
+    @staticmethod
+    def merge(results: Dict[str, SourceResult]) -> pd.DataFrame:
+        """Concatenate source frames on the union of their columns, tagging each row with its source
+
+        Rows are kept in source order; hostages listed by several sources are
+        resolved by deduplicate() once the frame is normalized.
+        """
+        frames = [result.data.assign(source=name) for name, result in results.items() if not result.data.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def deduplicate(self, df: pd.DataFrame, name_column: str = 'name',
+                    date_column: str = 'capture_date') -> pd.DataFrame:
+        """Drop rows of a merged, normalized frame that a higher-precedence source already provided
+
+        Two rows are the same hostage when their names match ignoring case and
+        whitespace and their capture dates fall on the same day. Rows without
+        a known name or capture date are always kept, as are repeats within a
+        single source.
+        """
+        if df.empty or not {'source', name_column, date_column} <= set(df.columns):
+            return df
+        names = df[name_column].astype('string').str.strip().str.replace(r'\s+', ' ', regex=True).str.casefold()
+        names = names.mask(names.isin(['', 'unknown']))
+        days = pd.to_datetime(df[date_column], errors='coerce').dt.normalize()
+        precedence = {source.name: rank for rank, source in enumerate(self.sources)}
+        rank = df['source'].astype(object).map(precedence).fillna(len(precedence)).astype(int)
+        first = rank.groupby([names, days], dropna=True).transform('min')
+        duplicate = (rank > first).fillna(False).to_numpy(dtype=bool)
+        if not duplicate.any():
+            return df
+        logger.info(f"Dropped {int(duplicate.sum())} rows already provided by a higher-precedence source")
+        return df[~duplicate].reset_index(drop=True)
+
+    def fetch_snapshot(self) -> pd.DataFrame:
+        """Fetch and merge all sources; raises when none of them returned data"""
+        results = self.fetch_all()
+        merged = self.merge(results)
+        if merged.empty:
+            errors = {name: result.error for name, result in results.items() if result.error}
+            raise ValueError(f"No data received from any source: {errors}")
+        return merged
+
+    def get_stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                name: {
+                    'rows': len(result.data),
+                    'elapsed': round(result.elapsed, 3),
+                    'error': result.error,
+                    'stale': result.stale
+                }
+                for name, result in self._last_results.items()
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
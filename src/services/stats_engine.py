@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+from src.core.constants import AGE_GROUPS
+from src.core.schema import get_schema
+from src.core.normalization import (
+    STATUS_CATEGORIES, AGE_GROUP_LABELS, normalize_status, age_group_codes, is_normalized_status
+)
+
+def empty_statistics() -> Dict:
+    return {
+        'summary': {'total': 0, 'released': 0, 'held': 0, 'deceased': 0, 'unknown': 0},
+        'age_stats': {'average_age': 0, 'median_age': 0, 'min_age': 0, 'max_age': 0},
+        'age_groups': {label: 0 for label in AGE_GROUP_LABELS}
+    }
+
+def compute_hostage_statistics(df: pd.DataFrame) -> Dict:
+    """Compute status counts, age statistics and age-group counts in one pass
+
+    The frame is read but never modified, so it is safe to call on the
+    shared cached snapshot.
+    """
+    stats = empty_statistics()
+    if df.empty:
+        return stats
+
+    total = len(df)
+    stats['summary']['total'] = total
+
+    if 'status' in df.columns:
+        status = df['status']
+        codes = status.cat.codes if is_normalized_status(status) else normalize_status(status).codes
+        codes = np.asarray(codes)
+        counts = np.bincount(codes[codes >= 0], minlength=len(STATUS_CATEGORIES))
+        for label, count in zip(STATUS_CATEGORIES, counts):
+            stats['summary'][label.lower()] = int(count)
+
+    if 'age' in df.columns:
+        ages = pd.to_numeric(df['age'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        # Only ages in the schema's range; the -1 "unknown" default and typos are left out
+        spec = get_schema('hostage').fields['age']
+        valid = ages[(ages >= spec.min_value) & (ages <= spec.max_value)]
+        if valid.size:
+            stats['age_stats'] = {
+                'average_age': float(valid.mean()),
+                'median_age': float(np.median(valid)),
+                'min_age': float(valid.min()),
+                'max_age': float(valid.max())
+            }
+        if 'age_group' in df.columns and isinstance(df['age_group'].dtype, pd.CategoricalDtype):
+            group_codes = np.asarray(df['age_group'].cat.codes)
+        else:
+            group_codes = age_group_codes(ages)
+        group_counts = np.bincount(group_codes[group_codes >= 0], minlength=len(AGE_GROUPS))
+        stats['age_groups'] = {label: int(count) for label, count in zip(AGE_GROUP_LABELS, group_counts)}
+
+    return stats
@@ -0,0 +1,193 @@
+import sys
+import threading
+import time
+import numpy as np
+import pandas as pd
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from .cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+def estimate_size(value: Any) -> int:
+    """Estimate the in-memory size of a cached value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if callable(getattr(value, 'memory_usage', None)):
+        # Columnar tables and other containers that report their own size
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+
+class MemoryLRU:
+    """Thread-safe LRU bounded by total bytes, with per-entry expiry"""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, sizeof: Callable[[Any], int] = estimate_size):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.current_bytes = 0
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        """Return the value for key, or default if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            logger.info(f"Not caching {key} in memory: {size} bytes exceeds the {self.max_bytes} byte limit")
+            self.pop(key)
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, expires_at)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def pop(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+
+@dataclass
+class _Flight:
+    """A load in progress that other callers for the same key wait on"""
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+class TieredCache:
+    """In-process LRU for values derived from the snapshots, with the on-disk CacheService alongside
+
+    Values are looked up in memory and otherwise produced by the loader;
+    concurrent misses for the same key share a single loader call. Keys are
+    versioned by the caller, so a new snapshot never needs invalidation.
+    ``disk`` is the persistent store for snapshots, which their owners
+    read and write directly.
+    """
+
+    def __init__(self, disk: Optional[CacheService] = None, max_memory_bytes: int = 256 * 1024 * 1024,
+                 default_ttl: float = 3600):
+        self.memory = MemoryLRU(max_memory_bytes)
+        self.disk = disk
+        self.default_ttl = default_ttl
+        self.stats = {'memory_hits': 0, 'misses': 0, 'loads': 0, 'shared_loads': 0}
+        self._in_flight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, key: str) -> Any:
+        """Look up key in memory; returns None on a miss"""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        value = self.memory.get(key)
+        if value is not _MISSING:
+            self._count('memory_hits')
+            return value
+        self._count('misses')
+        return _MISSING
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        self.memory.set(key, value, ttl=ttl)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for key, calling loader at most once across threads on a miss"""
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+
+        if not is_leader:
+            self._count('shared_loads')
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            # A previous leader may have stored the value since our lookup
+            value = self.memory.get(key)
+            if value is not _MISSING:
+                flight.value = value
+                return value
+            self._count('loads')
+            flight.value = loader()
+            self.set(key, flight.value, ttl=ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.event.set()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats.update({
+            'memory_entries': len(self.memory),
+            'memory_bytes': self.memory.current_bytes,
+            'memory_limit_bytes': self.memory.max_bytes
+        })
+        return stats
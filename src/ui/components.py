@@ -1,7 +1,10 @@
 import streamlit as st
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 import os
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class SidebarMenu:
     def __init__(self):
         if 'current_section' not in st.session_state:
@@ -16,7 +19,7 @@ class SidebarMenu:
             },
             "Data Management": {
                 "icon": "📁",
-                "items": ["Hostages", "News Updates", "IDF Data"]
+                "items": ["Hostages", "News Updates", "IDF Data", "Gallery"]
             },
             "Analytics": {
                 "icon": "📈",
@@ -81,4 +84,61 @@ class SidebarMenu:
                 
                 st.markdown("---")
             
-            return st.session_state.current_section, st.session_state.current_item
\ No newline at end of file
+            return st.session_state.current_section, st.session_state.current_item
+
+class PaginatedTable:
+    """Sortable table that only sends the visible page to the browser
+
+    ``fetch_page(sort_by, ascending, page, page_size, **filters)`` returns the
+    rows of one page and the total number of matching rows (e.g.
+    DataService.get_page), so sorting, filtering and paging all run on the
+    server and the payload stays one page whatever the size of the table.
+    """
+
+    def __init__(self, key: str, fetch_page: Callable[..., Tuple['pd.DataFrame', int]],
+                 sort_columns: List[str], page_size: int = 100, default_sort: Optional[str] = None):
+        self.key = key
+        self.fetch_page = fetch_page
+        self.sort_columns = sort_columns
+        self.page_size = page_size
+        self.default_sort = default_sort if default_sort in sort_columns else sort_columns[0]
+
+    def _state_key(self, name: str) -> str:
+        return f"{self.key}_{name}"
+
+    def render(self, **filters) -> int:
+        """Draw the sort and page controls and the current page; returns the number of matching rows"""
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            sort_by = st.selectbox("Sort by", self.sort_columns,
+                                   index=self.sort_columns.index(self.default_sort),
+                                   key=self._state_key('sort'))
+        with col2:
+            ascending = st.radio("Order", ["Ascending", "Descending"], horizontal=True,
+                                 key=self._state_key('order')) == "Ascending"
+
+        # Go back to the first page whenever the sort or filters change
+        page_key = self._state_key('page')
+        signature = (sort_by, ascending, tuple(sorted((k, str(v)) for k, v in filters.items())))
+        if st.session_state.get(self._state_key('signature')) != signature:
+            st.session_state[self._state_key('signature')] = signature
+            st.session_state[page_key] = 1
+
+        rows, total = self.fetch_page(sort_by=sort_by, ascending=ascending,
+                                      page=st.session_state.get(page_key, 1),
+                                      page_size=self.page_size, **filters)
+        pages = max((total - 1) // self.page_size + 1, 1)
+        if st.session_state.get(page_key, 1) > pages:
+            # The snapshot shrank under the current page
+            st.session_state[page_key] = pages
+            rows, total = self.fetch_page(sort_by=sort_by, ascending=ascending, page=pages,
+                                          page_size=self.page_size, **filters)
+
+        with col3:
+            page = st.number_input(f"Page (of {pages})", 1, pages, key=page_key)
+
+        first = (page - 1) * self.page_size
+        st.caption(f"Rows {min(first + 1, total)}-{first + len(rows)} of {total}")
+        if not rows.empty:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+        return total
@@ -0,0 +1,98 @@
+import html
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from typing import Dict, Hashable, List, Tuple
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+CSS_DIR = Path(__file__).resolve().parents[2] / 'assets' / 'css'
+
+# (direction, text-align) per interface language
+DIRECTIONS = {'he': ('rtl', 'right'), 'en': ('ltr', 'left')}
+READ_MORE = {'he': 'קרא עוד ←', 'en': 'Read more →'}
+
+# Compiled once; no indentation, so markdown keeps it one HTML block instead of a code block
+CARD_TEMPLATE = Template(
+    '<div class="update-card">'
+    '<a href="$link" target="_blank" class="update-title">$title</a>'
+    '<div class="update-meta">$date · <span class="source-badge">$source</span></div>'
+    '<div class="update-excerpt">$excerpt</div>'
+    '<a href="$link" target="_blank" class="read-more">$read_more</a>'
+    '</div>'
+)
+
+MAX_FRAGMENTS = 4096
+
+@lru_cache(maxsize=None)
+def read_css(name: str) -> str:
+    """Contents of a stylesheet in assets/css, read from disk once per process"""
+    try:
+        return (CSS_DIR / name).read_text(encoding='utf-8')
+    except OSError as e:
+        logger.error(f"Error reading stylesheet {name}: {str(e)}")
+        return ''
+
+@lru_cache(maxsize=None)
+def direction_styles(lang: str = 'he') -> str:
+    """<style> block aligning text for ``lang``"""
+    direction, align = DIRECTIONS.get(lang, DIRECTIONS['en'])
+    css = Template(read_css('direction.css')).safe_substitute(direction=direction, align=align)
+    return f"<style>\n{css}\n</style>"
+
+@lru_cache(maxsize=None)
+def card_styles() -> str:
+    """<style> block for update cards, sent only with the cards themselves"""
+    return f"<style>\n{read_css('update_cards.css')}\n</style>"
+
+class UpdateCardRenderer:
+    """HTML for update cards, each rendered once per (id, language, snapshot version)"""
+
+    def __init__(self, max_fragments: int = MAX_FRAGMENTS):
+        self.max_fragments = max_fragments
+        self._fragments: 'OrderedDict[Tuple[Hashable, str, int], str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fragment(self, update: Dict, version: int, lang: str) -> str:
+        key = (update.get('id', (update.get('title'), update.get('date'))), lang, version)
+        with self._lock:
+            cached = self._fragments.get(key)
+            if cached is not None:
+                self._fragments.move_to_end(key)
+                return cached
+
+        link = html.escape(str(update.get('link', '#')), quote=True)
+        fragment = CARD_TEMPLATE.substitute(
+            link=link,
+            title=html.escape(str(update.get('title', ''))),
+            date=html.escape(str(update.get('date', ''))),
+            source=html.escape(str(update.get('source', ''))),
+            excerpt=html.escape(str(update.get('excerpt', ''))),
+            read_more=READ_MORE.get(lang, READ_MORE['en'])
+        )
+        with self._lock:
+            self._fragments[key] = fragment
+            while len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def render(self, updates: List[Dict], version: int, lang: str) -> str:
+        """All cards as one HTML string, for a single markdown call"""
+        cards = ''.join(self.fragment(update, version, lang) for update in updates)
+        direction, _ = DIRECTIONS.get(lang, DIRECTIONS['en'])
+        return f'<div class="updates-container" dir="{direction}">{cards}</div>'
+
+_card_renderer = UpdateCardRenderer()
+
+def render_update_cards(updates: List[Dict], version: int, lang: str):
+    """Draw update cards, and the styles they need, with one st.markdown call
+
+    ``version`` is the snapshot version the updates came from, so cached
+    cards are never served for a newer snapshot.
+    """
+    if updates:
+        st.markdown(card_styles() + _card_renderer.render(updates, version, lang), unsafe_allow_html=True)
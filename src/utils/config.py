@@ -1,8 +1,8 @@
 import yaml
 from pathlib import Path
 from typing import Dict
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Tuple
 
 def load_config(config_path: str = "config.yaml") -> Dict:
     """Load configuration from YAML file"""
@@ -39,6 +39,13 @@ class DataSourceConfig:
     GOV_URL: str = "https://www.gov.il/en/pages/hostages-and-missing-persons-report"
     CSV_DIR: str = "data"
     CACHE_TIMEOUT: int = 3600  # 1 hour cache timeout
+    CSV_PATTERN: str = "hostages*.csv"
+    SOCIAL_PATTERN: str = "posts*.csv"
+    API_URL: str = ""  # The api source is skipped while this is empty
+    SOURCE_TIMEOUT: float = 20.0  # Seconds before a source's last good data is used instead
+    SOURCE_TIMEOUTS: Dict[str, float] = field(default_factory=lambda: {'csv': 60.0})
+    # (calls, seconds) per source
+    SOURCE_RATE_LIMITS: Dict[str, Tuple[int, float]] = field(default_factory=lambda: {'gov': (1, 5.0), 'api': (2, 1.0)})
 
 @dataclass
 class AppConfig:
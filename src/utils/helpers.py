@@ -5,9 +5,14 @@ from pathlib import Path
 import yaml
 import logging
 from typing import Dict, Any
+from src.core.schema import get_schema
+from src.ui.renderer import direction_styles
 
 logger = logging.getLogger(__name__)
 
+LANGUAGES = ('en', 'he')
+DEFAULT_LANGUAGE = 'en'
+
 def set_page_config():
     """Configure Streamlit page settings"""
     st.set_page_config(
@@ -19,43 +24,11 @@ def set_page_config():
 
 def setup_rtl_support(is_hebrew=True):
     """Add RTL/LTR support based on language"""
-    if is_hebrew:
-        rtl_css = """
-            <style>
-            .rtl {
-                direction: rtl;
-                text-align: right;
-            }
-            .stMarkdown, .stText {
-                text-align: right;
-            }
-            .st-emotion-cache-1y4p8pa {
-                direction: rtl;
-            }
-            .st-emotion-cache-16idsys p {
-                text-align: right;
-            }
-            </style>
-        """
-    else:
-        rtl_css = """
-            <style>
-            .rtl {
-                direction: ltr;
-                text-align: left;
-            }
-            .stMarkdown, .stText {
-                text-align: left;
-            }
-            .st-emotion-cache-1y4p8pa {
-                direction: ltr;
-            }
-            .st-emotion-cache-16idsys p {
-                text-align: left;
-            }
-            </style>
-        """
-    st.markdown(rtl_css, unsafe_allow_html=True)
+    st.markdown(direction_styles('he' if is_hebrew else 'en'), unsafe_allow_html=True)
+
+def get_language() -> str:
+    """Interface language chosen on the preferences page"""
+    return st.session_state.get('language', DEFAULT_LANGUAGE)
 
 def show_error(message, lang='he'):
     """Display error message in Hebrew/English"""
@@ -102,6 +75,7 @@ TRANSLATIONS = {
     'no_data': {'he': 'אין נתונים זמינים', 'en': 'No data available'},
     'data_loaded': {'he': 'הנתונים נטענו בהצלחה', 'en': 'Data loaded successfully'},
     'hostages_overview': {'he': 'סקירת חטופים', 'en': 'Hostages Overview'},
+    'latest_updates': {'he': 'עדכונים אחרונים', 'en': 'Latest Updates'},
     'total_hostages': {'he': 'סה״כ חטופים', 'en': 'Total Hostages'},
     'in_captivity_count': {'he': 'בשבי', 'en': 'In Captivity'},
     'released_count': {'he': 'שוחררו', 'en': 'Released'},
@@ -172,15 +146,24 @@ def get_translation(key: str, lang: str) -> str:
     """Get translation for a key in specified language"""
     return TRANSLATIONS.get(key, {}).get(lang, key)
 
+def _or_missing(value: Any) -> int:
+    return -1 if value is None else int(value)
+
 def clean_hostage_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Clean and validate hostage data"""
+    """Clean and validate hostage data
+
+    Names and numbers are cleaned by the hostage schema; missing or invalid
+    ages and day counts are -1, and status and capture_date are returned as
+    given.
+    """
     try:
+        record = get_schema('hostage').clean_record(data)
         return {
-            'name': str(data.get('name', 'Unknown')),
-            'age': int(data.get('age', -1)),
-            'location_taken': str(data.get('location_taken', 'Unknown')),
+            'name': record['name'],
+            'age': _or_missing(record['age']),
+            'location_taken': record['location_taken'],
             'status': str(data.get('status', 'Unknown')),
-            'days_in_captivity': int(data.get('days_in_captivity', -1)),
+            'days_in_captivity': _or_missing(record['days_in_captivity']),
             'capture_date': data.get('capture_date', '2023-10-07')
         }
     except Exception as e:
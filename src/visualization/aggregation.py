@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+# Bucket resolutions from finest to coarsest, as numpy datetime64 units
+RESOLUTIONS = {
+    'minute': 'datetime64[m]',
+    'hour': 'datetime64[h]',
+    'day': 'datetime64[D]'
+}
+
+DEFAULT_MAX_POINTS = 2000
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the visual shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Interior points are split into n_out - 2 buckets; first and last are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        indices[i + 1] = previous
+    return indices
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the min and max of each of n_out / 2 equal buckets (keeps spikes)"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+
+    n_buckets = n_out // 2
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    y = np.asarray(y, dtype=float)
+    picked = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        bucket = y[start:end]
+        picked.extend((start + int(np.argmin(bucket)), start + int(np.argmax(bucket))))
+    return np.unique(picked)
+
+class TimeBuckets:
+    """Per-minute, per-hour and per-day rollups of a post-level frame
+
+    Built once per ingest; charts then read a rollup sized for the number of
+    points they can usefully draw instead of grouping the raw rows again.
+    Each rollup is indexed by bucket start and has one summed column per
+    metric plus a ``posts`` count.
+    """
+
+    def __init__(self, rollups: Dict[str, pd.DataFrame], metrics: Sequence[str]):
+        self.rollups = rollups
+        self.metrics = list(metrics)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, date_col: str = 'date',
+                   metrics: Sequence[str] = ('likes', 'retweets')) -> 'TimeBuckets':
+        metrics = [col for col in metrics if col in df.columns]
+        dates = pd.to_datetime(df[date_col], errors='coerce')
+        valid = dates.notna().to_numpy()
+        timestamps = dates.to_numpy()[valid]
+
+        finest = pd.DataFrame(
+            {col: pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy()[valid] for col in metrics}
+        )
+        finest['posts'] = 1
+        finest['bucket'] = timestamps.astype(RESOLUTIONS['minute'])
+
+        rollups = {}
+        current = finest
+        for name, unit in RESOLUTIONS.items():
+            # Each level is rolled up from the previous one, not from the raw rows
+            current = current.assign(bucket=current['bucket'].to_numpy().astype(unit))
+            current = current.groupby('bucket', sort=True).sum().reset_index()
+            rollups[name] = current.set_index('bucket')
+        return cls(rollups, metrics)
+
+    def memory_usage(self, deep: bool = True) -> int:
+        """Bytes held by all rollups"""
+        return sum(int(frame.memory_usage(deep=deep).sum()) for frame in self.rollups.values())
+
+    def resolution_for(self, max_points: int) -> str:
+        """Finest resolution whose bucket count fits in max_points"""
+        for name in RESOLUTIONS:
+            if len(self.rollups[name]) <= max_points:
+                return name
+        return list(RESOLUTIONS)[-1]
+
+    def series(self, columns: Optional[List[str]] = None, max_points: int = DEFAULT_MAX_POINTS,
+               method: str = 'lttb') -> pd.DataFrame:
+        """Rollup with at most max_points rows, downsampled if even daily buckets are too many"""
+        columns = columns or self.metrics
+        frame = self.rollups[self.resolution_for(max_points)][columns]
+        if len(frame) <= max_points:
+            return frame
+
+        x = frame.index.to_numpy().astype('datetime64[s]').astype(float)
+        keep = set()
+        per_column = max(max_points // max(len(columns), 1), 3)
+        for col in columns:
+            y = frame[col].to_numpy()
+            picked = lttb_indices(x, y, per_column) if method == 'lttb' else minmax_indices(y, per_column)
+            keep.update(picked.tolist())
+        return frame.iloc[sorted(keep)]
+
+    def hour_of_day_means(self) -> pd.DataFrame:
+        """Average per-post metrics by hour of day, from the hourly rollup"""
+        hourly = self.rollups['hour']
+        by_hour = hourly.groupby(hourly.index.hour).sum()
+        means = by_hour[self.metrics].div(by_hour['posts'], axis=0)
+        means['total_engagement'] = means[self.metrics].sum(axis=1)
+        means.index.name = 'hour'
+        return means.round(2)
@@ -2,15 +2,22 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import streamlit as st
+from typing import Optional
+from .aggregation import TimeBuckets, DEFAULT_MAX_POINTS
 
-def create_time_series(df: pd.DataFrame) -> go.Figure:
-    """Create time series visualization based on data type"""
+def create_time_series(df: pd.DataFrame, buckets: Optional[TimeBuckets] = None,
+                       max_points: int = DEFAULT_MAX_POINTS) -> go.Figure:
+    """Create time series visualization based on data type
+
+    For social media data pass the ``TimeBuckets`` built at ingest to avoid
+    re-aggregating the raw posts; the trace never exceeds ``max_points``.
+    """
     try:
         if 'text' in df.columns:  # Social media data
-            daily_engagement = df.groupby('date').agg({
-                'likes': 'sum',
-                'retweets': 'sum'
-            }).reset_index()
+            if buckets is None:
+                buckets = TimeBuckets.from_frame(df)
+            engagement = buckets.series(['likes', 'retweets'], max_points=max_points)
+            daily_engagement = engagement.rename_axis('date').reset_index()
             
             fig = px.line(daily_engagement, x='date', 
                          y=['likes', 'retweets'],
@@ -88,21 +95,16 @@ def create_age_distribution(df: pd.DataFrame) -> go.Figure:
         st.error(f"Error creating age distribution: {str(e)}")
         return None
 
-def create_social_metrics(df: pd.DataFrame) -> go.Figure:
+def create_social_metrics(df: pd.DataFrame, buckets: Optional[TimeBuckets] = None) -> go.Figure:
     """Create social media metrics visualization"""
     try:
         if 'text' not in df.columns:
             return None
             
-        # Calculate engagement metrics
-        df['total_engagement'] = df['likes'] + df['retweets']
-        df['hour'] = pd.to_datetime(df['date']).dt.hour
-        
-        hourly_metrics = df.groupby('hour').agg({
-            'likes': 'mean',
-            'retweets': 'mean',
-            'total_engagement': 'mean'
-        }).round(2)
+        # Hour-of-day means come from the hourly rollup, not the raw posts
+        if buckets is None:
+            buckets = TimeBuckets.from_frame(df)
+        hourly_metrics = buckets.hour_of_day_means()
         
         fig = px.line(hourly_metrics, 
                      title='Average Engagement by Hour',
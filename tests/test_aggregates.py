@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+from app.data_handlers.aggregates import NumericSummary, RowCount, StreamingAggregate, ValueCounts
+
+def test_incomplete_aggregate_fails_on_creation():
+    class OnlyUpdate(StreamingAggregate):
+        def update(self, chunk):
+            pass
+
+    with pytest.raises(TypeError):
+        OnlyUpdate()
+
+def test_aggregates_combine_chunks():
+    running = [RowCount(), ValueCounts('status'), NumericSummary('age')]
+    for chunk in (pd.DataFrame({'status': ['Held', 'Released'], 'age': [20, -1]}),
+                  pd.DataFrame({'status': ['Held'], 'age': [40]})):
+        for aggregate in running:
+            aggregate.update(chunk)
+
+    rows, statuses, ages = (aggregate.result() for aggregate in running)
+    assert rows == 3
+    assert statuses == {'Held': 2, 'Released': 1}
+    assert ages == {'count': 2, 'mean': 30.0, 'min': 20.0, 'max': 40.0}
@@ -0,0 +1,48 @@
+import pandas as pd
+
+from src.services.data_service import DataService
+from src.services.tiered_cache import TieredCache
+
+def _write_hostages(path, rows):
+    pd.DataFrame(rows, columns=['name', 'age', 'status', 'capture_date', 'location_taken']).to_csv(path, index=False)
+
+def test_csv_source_is_read_incrementally_and_derives_days(tmp_path):
+    _write_hostages(tmp_path / 'hostages_a.csv', [['Noa', 25, 'Held', '2023-10-07', 'Nova']])
+    _write_hostages(tmp_path / 'hostages_b.csv', [['Avi', 40, 'Released', '2023-10-07', 'Beeri']])
+    service = DataService(str(tmp_path), cache=TieredCache(), sources=('csv',),
+                          analytics_path=str(tmp_path / 'analytics.db'))
+
+    df = service._fetch_hostages()
+    assert sorted(df['name']) == ['Avi', 'Noa']
+    # Defaults are left to normalization, so days are derived from capture_date
+    assert (df['days_in_captivity'] > 0).all()
+
+    _write_hostages(tmp_path / 'hostages_b.csv', [['Avi', 41, 'Released', '2023-10-07', 'Beeri']])
+    df = service._fetch_hostages()
+    assert service.csv_handler.last_diff.changed == ['hostages_b.csv']
+    assert service.csv_handler.last_diff.unchanged == ['hostages_a.csv']
+    assert df.set_index('name')['age'].to_dict() == {'Noa': 25, 'Avi': 41}
+
+def test_gallery_page_without_images(tmp_path):
+    image = tmp_path / 'noa.jpg'
+    image.write_bytes(b'not really a jpeg')
+    _write_hostages(tmp_path / 'hostages_a.csv', [['Noa', 25, 'Held', '2023-10-07', 'Nova'],
+                                                   ['Avi', 40, 'Released', '2023-10-07', 'Beeri']])
+    service = DataService(str(tmp_path), cache=TieredCache(), sources=('csv',),
+                          analytics_path=str(tmp_path / 'analytics.db'))
+
+    # No local_image_path column at all
+    service.hostages_refresher.refresh()
+    page, total = service.get_gallery_page()
+    assert total == 2
+    assert page['thumbnail'].tolist() == [None, None]
+
+    # One row with an image, one without
+    df = pd.read_csv(tmp_path / 'hostages_a.csv')
+    df['local_image_path'] = [str(image), None]
+    df.to_csv(tmp_path / 'hostages_a.csv', index=False)
+    service.hostages_refresher.refresh()
+    page, total = service.get_gallery_page()
+    thumbnails = dict(zip(page['name'], page['thumbnail']))
+    assert thumbnails['Noa'] is not None
+    assert thumbnails['Avi'] is None
@@ -0,0 +1,63 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from app.data_handlers import DatabaseHandler
+from src.services import database
+from src.services.database import build_select
+
+ROWS = [
+    (1, 'Noa', 25, 'Held', '2023-10-07'),
+    (2, 'Avi', 40, 'released', '2023-10-07'),
+    (3, 'Dana', 8, 'held', '2023-10-08'),
+    (4, 'Eli', 70, 'Deceased', '2023-10-09'),
+    (5, 'Maya', 33, 'Held', '2023-10-10'),
+]
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'hostages.db'
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE hostages (id INTEGER, name TEXT, age INTEGER, status TEXT, capture_date TEXT)')
+        conn.executemany('INSERT INTO hostages VALUES (?, ?, ?, ?, ?)', ROWS)
+    return path
+
+@pytest.fixture(params=['sqlite_pool', 'sqlalchemy'])
+def handler(request, db_path, monkeypatch):
+    if request.param == 'sqlite_pool':
+        # Without SQLAlchemy, sqlite:/// URLs use the built-in connection pool
+        monkeypatch.setattr(database, 'sqlalchemy', None)
+    else:
+        pytest.importorskip('sqlalchemy')
+    handler = DatabaseHandler(f'sqlite:///{db_path}')
+    assert (handler.db._pool is None) == (request.param == 'sqlalchemy')
+    yield handler
+    handler.db.close()
+
+def test_filters_run_in_the_database(handler):
+    df = handler.read_data(status=['Held'], min_age=10, order_by='age')
+    assert df['name'].tolist() == ['Noa', 'Maya']
+    assert (df['status'] == 'Held').all()
+
+    df = handler.read_data(date_from='2023-10-08', date_to='2023-10-09', order_by='-capture_date')
+    assert df['name'].tolist() == ['Eli', 'Dana']
+
+def test_order_limit_and_offset(handler):
+    df = handler.read_data(order_by='-age', limit=2, offset=1)
+    assert df['name'].tolist() == ['Avi', 'Maya']
+
+    chunks = list(handler.iter_chunks(chunksize=2, columns=['name'], order_by='id'))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks)['name'].tolist() == [name for _, name, *_ in ROWS]
+
+def test_identifiers_are_rejected(handler, db_path):
+    for kwargs in ({'columns': ['name; DROP TABLE hostages']}, {'order_by': 'age; DROP TABLE hostages'}):
+        with pytest.raises(ValueError, match='Invalid SQL identifier'):
+            build_select('hostages', **kwargs)
+        assert handler.read_data(**kwargs).empty
+    with pytest.raises(ValueError):
+        build_select('hostages"; --')
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM hostages').fetchone() == (len(ROWS),)
@@ -0,0 +1,94 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import pytest
+from src.services.cache_service import CacheService
+from src.services.http_client import HTTPClient, build_session
+
+ITEMS = [{'id': 1, 'name': 'Noa'}, {'id': 2, 'name': 'Avi'}]
+ETAG = '"items-v1"'
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so pooled connections are reused
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b'', headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.connections.add(self.client_address)
+        if self.path == '/items':
+            if self.headers.get('If-None-Match') == ETAG:
+                self._send(304, headers={'ETag': ETAG})
+            else:
+                self._send(200, json.dumps(ITEMS).encode(), {'ETag': ETAG, 'Content-Type': 'application/json'})
+        elif self.path == '/flaky':
+            with server.lock:
+                server.failures_left -= 1
+                failing = server.failures_left >= 0
+            if failing:
+                self._send(503)
+            else:
+                self._send(200, json.dumps(ITEMS).encode(), {'Content-Type': 'application/json'})
+        else:
+            self._send(404)
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.connections = set()
+    httpd.failures_left = 2
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def url(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+def parse(response) -> pd.DataFrame:
+    return pd.DataFrame(response.json())
+
+def test_etag_revalidation_reuses_cached_frame(server, tmp_path):
+    client = HTTPClient(CacheService(str(tmp_path)), session=build_session(backoff_factor=0))
+
+    first = client.fetch(url(server, '/items'), parse)
+    second = client.fetch(url(server, '/items'), parse)
+
+    assert first.status_code == 200 and not first.not_modified
+    assert second.status_code == 304 and second.not_modified
+    pd.testing.assert_frame_equal(second.data, first.data, check_dtype=False)
+    assert client.get_stats() == {'requests': 2, 'not_modified': 1, 'downloads': 1}
+
+def test_service_unavailable_is_retried(server):
+    client = HTTPClient(session=build_session(retries=3, backoff_factor=0))
+
+    result = client.fetch(url(server, '/flaky'), parse)
+
+    assert result.status_code == 200
+    assert result.data['name'].tolist() == ['Noa', 'Avi']
+    assert server.requests == ['/flaky'] * 3
+
+def test_requests_share_a_pooled_connection(server):
+    client = HTTPClient(session=build_session(backoff_factor=0))
+
+    for _ in range(5):
+        client.fetch(url(server, '/items'), parse)
+
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
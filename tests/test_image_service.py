@@ -0,0 +1,16 @@
+import pandas as pd
+
+from src.services.image_service import ImageService
+
+def test_build_index_uses_none_for_missing_images(tmp_path):
+    image = tmp_path / 'noa.jpg'
+    image.write_bytes(b'not really a jpeg')
+    service = ImageService(str(tmp_path / 'thumbnails'))
+
+    df = pd.DataFrame({'local_image_path': [str(image), None, str(tmp_path / 'missing.jpg'), str(image)]})
+    digests = service.build_index(df)
+    assert digests[0] == digests[3] == service.digest(str(image))
+    assert digests[1] is None and digests[2] is None
+
+    digests = service.build_index(pd.DataFrame({'name': ['Noa', 'Avi']}))
+    assert digests.tolist() == [None, None]
@@ -0,0 +1,15 @@
+import pandas as pd
+from src.core.normalization import snapshot_view
+
+def test_snapshot_view_edits_stay_local():
+    snapshot = pd.DataFrame({'age': [30, 40], 'name': ['a', 'b']})
+    view = snapshot_view(snapshot, 7)
+
+    view.loc[0, 'age'] = 99
+    view['name'] = view['name'].str.upper()
+    view['extra'] = 1
+
+    assert view.attrs['snapshot_version'] == 7
+    assert snapshot['age'].tolist() == [30, 40]
+    assert snapshot['name'].tolist() == ['a', 'b']
+    assert 'extra' not in snapshot.columns
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+from src.services.stats_engine import compute_hostage_statistics
+
+def test_age_stats_ignore_sentinels_and_out_of_range_ages():
+    df = pd.DataFrame({
+        'status': ['Held', 'Released', 'Held', 'Deceased', 'Held'],
+        'age': pd.array([-1, 10, 30, 150, None], dtype='Int16')
+    })
+    stats = compute_hostage_statistics(df)
+
+    assert stats['age_stats'] == {'average_age': 20.0, 'median_age': 20.0, 'min_age': 10.0, 'max_age': 30.0}
+    assert sum(stats['age_groups'].values()) == 2
+    assert stats['summary']['total'] == 5
+
+def test_age_stats_without_valid_ages_stay_empty():
+    df = pd.DataFrame({'status': ['Held', 'Held'], 'age': [-1, np.nan]})
+    stats = compute_hostage_statistics(df)
+
+    assert stats['age_stats'] == {'average_age': 0, 'median_age': 0, 'min_age': 0, 'max_age': 0}
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from app.validation import schema as validation
+
+def test_flags_and_failure_counts_match_row_validation():
+    df = pd.DataFrame({
+        'name': ['Noa', '', 'Avi', None],
+        'age': [25, -1, '1_000', 'abc'],
+        'location_taken': ['Beeri', 'Nir Oz', ' ', 'Kfar Aza'],
+        'days_in_captivity': [10, 5, -1, 0]
+    })
+    validator = validation.DataValidator()
+    records = df.to_dict('records')
+    result = validator.validate_dataframe(df.copy())
+
+    bits = {column: 1 << i for i, column in enumerate(validation.VALIDATED_COLUMNS)}
+    expected_flags = [
+        sum(bit for column, bit in bits.items() if not validator.validate_record(record)[column])
+        for record in records
+    ]
+    assert result['validation_flags'].tolist() == expected_flags
+    assert result['validation_status'].tolist() == ['valid', 'invalid', 'invalid', 'invalid']
+    assert result.attrs['validation_failure_counts'] == {
+        'age': 3, 'name': 2, 'location_taken': 1, 'days_in_captivity': 1
+    }